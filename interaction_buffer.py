@@ -0,0 +1,77 @@
+"""
+Bufor interakcji - kolumny NumPy zamiast listy słowników.
+Używany przez storage (odczyt z bazy), statistics (krzywa uczenia, trend) i ml_model (trening).
+"""
+
+import numpy as np
+
+
+class InteractionBuffer:
+    """
+    Interakcje jako równoległe tablice NumPy (struct-of-arrays) zamiast listy słowników.
+    
+    Statystyki i trening czytają całe kolumny naraz (np. feedback > 0) - bez
+    odczytu klucza ze słownika dla każdego wiersza.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Inicjalizacja pustego bufora.
+        
+        Args:
+            capacity: Początkowy rozmiar tablic (rośnie x2 przy zapełnieniu)
+        """
+        self._inputs = np.empty(capacity, dtype=np.int64)
+        self._outputs = np.empty(capacity, dtype=np.int64)
+        self._feedback = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+    
+    @classmethod
+    def from_arrays(cls, inputs: np.ndarray, outputs: np.ndarray, feedback: np.ndarray) -> 'InteractionBuffer':
+        """Tworzy bufor z gotowych kolumn (kopiuje dane)."""
+        buffer = cls(capacity=max(16, len(inputs)))
+        buffer._inputs[:len(inputs)] = inputs
+        buffer._outputs[:len(outputs)] = outputs
+        buffer._feedback[:len(feedback)] = feedback
+        buffer._size = len(inputs)
+        return buffer
+    
+    @property
+    def inputs(self) -> np.ndarray:
+        """Inputy użytkownika."""
+        return self._inputs[:self._size]
+    
+    @property
+    def outputs(self) -> np.ndarray:
+        """Oczekiwane outputy."""
+        return self._outputs[:self._size]
+    
+    @property
+    def feedback(self) -> np.ndarray:
+        """Wartości feedbacku."""
+        return self._feedback[:self._size]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: slice) -> 'InteractionBuffer':
+        return InteractionBuffer.from_arrays(self.inputs[index], self.outputs[index], self.feedback[index])
+    
+    def append(self, user_input: int, output: int, feedback_value: float) -> None:
+        """Dopisuje jedną interakcję (amortyzowane O(1))."""
+        if self._size == len(self._inputs):
+            self._grow()
+        
+        self._inputs[self._size] = user_input
+        self._outputs[self._size] = output
+        self._feedback[self._size] = feedback_value
+        self._size += 1
+    
+    def _grow(self) -> None:
+        """Podwaja pojemność tablic."""
+        capacity = max(16, 2 * len(self._inputs))
+        for name in ('_inputs', '_outputs', '_feedback'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
@@ -5,11 +5,24 @@ Number Learning AI - Interaktywna aplikacja konsolowa z ML.
 Użytkownik podaje liczby, AI odpowiada, użytkownik ocenia.
 AI uczy się preferencji użytkownika i z czasem daje lepsze odpowiedzi.
 
-Algorytm: Epsilon-Greedy + LinearRegression
+Algorytm: Epsilon-Greedy + regresja wielomianowa (stopień 3)
 """
 
+import argparse
+import ast
+import functools
 import sys
-from typing import Optional
+import threading
+import time
+from types import CodeType
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba jest opcjonalna - bez niej wyrażenia liczone są zwykłym NumPy
+    numba = None
 
 from storage import DataStorage
 from ml_model import MLModel
@@ -17,18 +30,194 @@ from statistics import Statistics
 from ui import UI
 
 
+def _invalid_operation(numbers: np.ndarray) -> np.ndarray:
+    """Operacja bez prawidłowego wyniku (np. dzielenie przez 0) - same zera."""
+    return np.zeros_like(numbers)
+
+
+def _build_multiply(arg: str) -> Callable[[np.ndarray], np.ndarray]:
+    # Mnożenie: *2, *3 itp.
+    multiplier = float(arg)
+    return lambda numbers: (numbers * multiplier).astype(np.int64)
+
+
+def _build_divide(arg: str) -> Callable[[np.ndarray], np.ndarray]:
+    # Dzielenie: /2, /3 itp.
+    divisor = float(arg)
+    if divisor == 0:
+        return _invalid_operation
+    return lambda numbers: (numbers / divisor).astype(np.int64)
+
+
+def _build_add(arg: str) -> Callable[[np.ndarray], np.ndarray]:
+    # Dodawanie: +10, +100 itp.
+    addend = int(arg)
+    return lambda numbers: numbers + addend
+
+
+def _build_subtract(arg: str) -> Callable[[np.ndarray], np.ndarray]:
+    # Odejmowanie: -10, -50 itp. (wyniki <= 0 odrzuca wywołujący)
+    subtrahend = int(arg)
+    return lambda numbers: numbers - subtrahend
+
+
+def _build_power(arg: str) -> Callable[[np.ndarray], np.ndarray]:
+    # Potęga: ^2, ^3 itp. - ograniczona do rozsądnych wartości
+    exponent = int(arg)
+    
+    def power(numbers: np.ndarray) -> np.ndarray:
+        # Licz na float, żeby wykryć przekroczenie limitu zamiast przepełnienia int64
+        powered = numbers.astype(np.float64) ** exponent
+        return np.where(powered < 10**10, numbers ** exponent, 0)
+    
+    return power
+
+
+def _build_modulo(arg: str) -> Callable[[np.ndarray], np.ndarray]:
+    # Modulo: %10, %100 itp. - jeśli 0, zwróć oryginalną liczbę
+    modulo = int(arg)
+    if modulo == 0:
+        return _invalid_operation
+    
+    def remainder(numbers: np.ndarray) -> np.ndarray:
+        result = numbers % modulo
+        return np.where(result > 0, result, numbers)
+    
+    return remainder
+
+
+# Węzły AST dozwolone w wyrażeniach z 'x' - tylko liczby, x i operatory arytmetyczne
+_ALLOWED_EXPRESSION_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_expression(expression: str) -> CodeType:
+    """
+    Parsuje i kompiluje wyrażenie z 'x' raz (wynik cache'owany per wyrażenie).
+    
+    Drzewo AST jest sprawdzane przed kompilacją - wywołania funkcji, atrybuty,
+    inne nazwy niż 'x' itp. są odrzucane z ValueError.
+    """
+    tree = ast.parse(expression, mode='eval')
+    
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_EXPRESSION_NODES):
+            raise ValueError(f"Niedozwolony element wyrażenia: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id != 'x':
+            raise ValueError(f"Nieznana zmienna: {node.id}")
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool)
+                                               or not isinstance(node.value, (int, float))):
+            raise ValueError(f"Niedozwolona stała: {node.value!r}")
+    
+    return compile(tree, '<operation>', 'eval')
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_numba_kernel(expression: str) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Kompiluje wyrażenie z 'x' do ufunc Numby (jedna pętla w kodzie maszynowym,
+    bez tablic pośrednich dla każdego pod-wyrażenia). Wynik cache'owany per wyrażenie.
+    """
+    _compile_expression(expression)  # walidacja AST przed wygenerowaniem kodu
+    namespace = {'__builtins__': {}}
+    exec(f"def _kernel(x):\n    return {expression}\n", namespace)
+    return numba.vectorize(['float64(float64)'])(namespace['_kernel'])
+
+
+# Proste operatory bez 'x' - wybierane po pierwszym znaku operacji. Budowniczy dostaje
+# resztę operacji i zwraca funkcję tablica -> tablica (wartości <= 0 = nieprawidłowy wynik);
+# jedna tabela obsługuje zarówno tryby wektorowe, jak i _compile_operation dla jednej liczby.
+# Uwaga: '**2' trafia do mnożenia (jak wcześniej w łańcuchu startswith) i jest nieprawidłowe.
+_OPERATION_BUILDERS = {
+    '*': _build_multiply,
+    '/': _build_divide,
+    '+': _build_add,
+    '-': _build_subtract,
+    '^': _build_power,
+    '%': _build_modulo,
+}
+
+# Mapowanie feedbacku na wartość numeryczną
+FEEDBACK_VALUES = {
+    'dislike': 0.0,  # Błędna odpowiedź
+    'like': 1.0      # Idealna odpowiedź
+}
+
+# Co ile przykładów zapisywać zebrane interakcje jedną transakcją (auto_train / testing_model)
+BULK_FLUSH_EVERY = 200
+
+# Ile sekund czekać po zmianie modelu zanim wątek w tle go zapisze
+MODEL_SAVE_DEBOUNCE = 2.0
+
+# Przedziały losowania inputów w auto-treningu (więcej małych liczb): [low, high) i ich szanse
+AUTO_TRAIN_BUCKET_LOW = np.array([1, 21, 101])
+AUTO_TRAIN_BUCKET_HIGH = np.array([21, 101, 1001])
+AUTO_TRAIN_BUCKET_P = [0.3, 0.3, 0.4]
+
+
 class NumberLearningApp:
     """Główna aplikacja - orchestrator wszystkich komponentów."""
     
-    def __init__(self):
-        """Inicjalizacja aplikacji i wszystkich modułów."""
-        self.ui = UI()
+    def __init__(self, verbose_progress: bool = True):
+        """
+        Inicjalizacja aplikacji i wszystkich modułów.
+        
+        Args:
+            verbose_progress: False = bez bieżącej linii postępu w testowaniu (tylko wynik końcowy)
+        """
+        self.ui = UI(verbose_progress=verbose_progress)
         self.storage = DataStorage()
         self.model = MLModel()
         self.stats = Statistics()
         
         # Wczytaj istniejący model jeśli istnieje
         self._load_existing_model()
+        
+        # Każda zmiana modelu (i podmiana self.model) odbywa się pod _model_lock,
+        # więc wątek zapisu widzi zawsze spójny stan - współczynniki i równania normalne razem
+        self._model_lock = threading.RLock()
+        
+        # Okresowe zapisy modelu robi wątek w tle - pętla tylko oznacza model jako zmieniony
+        self._model_dirty = threading.Event()
+        self._model_saver_stop = threading.Event()
+        self._model_save_lock = threading.Lock()
+        self._model_saver_thread = threading.Thread(target=self._model_saver, daemon=True)
+        self._model_saver_thread.start()
+    
+    def _model_saver(self) -> None:
+        """Wątek w tle: zapisuje zmieniony model, łącząc serię zmian w jeden zapis."""
+        while not self._model_saver_stop.is_set():
+            self._model_dirty.wait()
+            # Czekanie na stop zamiast sleep - zatrzymanie nie czeka pełnego MODEL_SAVE_DEBOUNCE
+            if self._model_saver_stop.wait(MODEL_SAVE_DEBOUNCE):
+                break
+            self._model_dirty.clear()
+            try:
+                self._save_model_now()
+            except Exception as e:
+                # Błąd jednego zapisu (np. pełny dysk) nie może zatrzymać kolejnych
+                self.ui.show_error(f"Błąd zapisu modelu w tle: {e}")
+    
+    def _stop_model_saver(self) -> None:
+        """Zatrzymuje wątek zapisu w tle i czeka na jego zakończenie (przed zamknięciem bazy)."""
+        self._model_saver_stop.set()
+        self._model_dirty.set()  # obudź wątek czekający na zmianę
+        self._model_saver_thread.join()
+    
+    def _save_model_now(self) -> None:
+        """
+        Zapisuje model synchronicznie (z blokadą, żeby nie kolidować z wątkiem w tle).
+        
+        Stan modelu jest kopiowany pod _model_lock, a sam zapis na dysk odbywa się
+        już bez niej - wątek główny nie czeka na fsync.
+        """
+        with self._model_lock:
+            snapshot = MLModel.from_state(self.model.get_state())
+        with self._model_save_lock:
+            self.storage.save_model(snapshot)
     
     def _load_existing_model(self) -> None:
         """Próbuje wczytać zapisany model z poprzedniej sesji."""
@@ -147,12 +336,15 @@ class NumberLearningApp:
         # Dodaj formatowanie czasu
         session_stats['duration_str'] = self.stats.format_duration(session_stats['duration'])
         
+        # Jedno zapytanie - ostatnie 20 interakcji to początek ostatnich 1000.
+        # Kolumny NumPy zamiast listy słowników - statystyki liczone są na całych tablicach.
+        all_interactions = self.storage.get_recent_interactions_buffer(limit=1000)
+        
         # Trend
-        recent_interactions = self.storage.get_recent_interactions(limit=20)
+        recent_interactions = all_interactions[:20]
         trend = self.stats.calculate_trend(recent_interactions, recent_n=min(20, len(recent_interactions)))
         
         # Krzywa uczenia
-        all_interactions = self.storage.get_recent_interactions(limit=1000)
         learning_curve = self.stats.calculate_learning_curve(all_interactions, window_size=10)
         chart = self.stats.generate_mini_chart(learning_curve, height=5, width=50)
         
@@ -166,18 +358,54 @@ class NumberLearningApp:
     
     def _retrain_model(self) -> None:
         """Przetrenuję model na wszystkich danych historycznych."""
-        self.ui.show_retrain_progress()
+        def retrain() -> None:
+            self._retrain_from_database()
         
-        all_interactions = self.storage.get_all_interactions()
-        self.model.batch_retrain(all_interactions)
+        self.ui.show_retrain_progress(retrain)
         
         # Zapisz przetrenowany model
-        self.storage.save_model(self.model)
+        self._save_model_now()
+    
+    def _retrain_from_database(self) -> None:
+        """Trenuje model od zera na całej historii i zapamiętuje wersję danych, z których powstał."""
+        data_version = self.storage.data_version
+        training_data = self.storage.get_all_interactions_arrays()
+        with self._model_lock:
+            self.model.batch_retrain_arrays(training_data['x'], training_data['y'], training_data['fv'])
+            self.model.data_version = data_version
+    
+    def _model_matches_database(self) -> bool:
+        """
+        Czy równania normalne modelu obejmują dokładnie pozytywne przykłady z bazy.
+        
+        Ta sama wersja danych oznacza, że od zbudowania równań baza była tylko
+        dopisywana, więc zgodna liczba pozytywnych przykładów wyznacza te same dane.
+        Model wczytany z innego zapisu, nowy albo sprzed resetu/cofnięcia ma inną wersję.
+        """
+        db_stats = self.storage.get_statistics()
+        with self._model_lock:
+            return (self.model.data_version == self.storage.data_version
+                    and self.model.moment_count == db_stats['likes'] + db_stats['loves'])
+    
+    def _refit_model(self) -> None:
+        """
+        Przelicza model po nowych interakcjach.
+        
+        Jeśli równania normalne modelu obejmują dokładnie pozytywne przykłady z bazy,
+        wystarczy je rozwiązać (O(1)). W przeciwnym razie (np. nowy, wczytany albo
+        stary model) model jest trenowany od zera na całej historii.
+        """
+        with self._model_lock:
+            if self._model_matches_database() and self.model.refit_from_moments():
+                return
+        
+        self._retrain_from_database()
     
     def _create_new_model(self) -> None:
         """Tworzy nowy, czysty model od zera."""
         if self.ui.confirm_new_model():
-            self.model = MLModel()
+            with self._model_lock:
+                self.model = MLModel()
             self.ui.show_new_model_created()
     
     def _save_model_as(self) -> None:
@@ -210,13 +438,16 @@ class NumberLearningApp:
         loaded_model = self.storage.load_model_by_name(model_name)
         
         if loaded_model:
-            self.model = loaded_model
+            with self._model_lock:
+                self.model = loaded_model
             self.ui.show_model_loaded(model_name)
         else:
             self.ui.show_error(f"Model '{model_name}' nie istnieje!")
     
     def _undo_last_interaction(self) -> None:
         """Cofa ostatnią interakcję - usuwa z bazy i przetrenuję model."""
+        # Zgodność modelu z bazą trzeba sprawdzić przed usunięciem - usunięcie zmienia wersję danych
+        in_sync = self._model_matches_database()
         deleted = self.storage.delete_last_interaction()
         
         if not deleted:
@@ -228,13 +459,27 @@ class NumberLearningApp:
         self.ui.show_info(f"   Input: {deleted['user_input']} → Output: {deleted['model_output']}")
         self.ui.show_info(f"   Feedback: {deleted['feedback']} ({deleted['feedback_value']})")
         
-        # Przetrenuję model na pozostałych danych
-        self._retrain_model()
+        # Cofnij wkład usuniętego przykładu z modelu (bez trenowania od zera).
+        # Jeśli model nie był zgodny z bazą (np. inny lub stary zapis modelu) - pełny retrain.
+        expected_output = deleted['expected_output']
+        if expected_output is None:
+            expected_output = deleted['model_output']
+        
+        with self._model_lock:
+            downdated = in_sync and self.model.downdate(deleted['user_input'], expected_output,
+                                                        deleted['feedback_value'])
+            if downdated:
+                self.model.data_version = self.storage.data_version
+        if downdated:
+            self._save_model_now()
+        else:
+            self._retrain_model()
         
         # Aktualizuj liczniki
-        self.model.interaction_count = max(0, self.model.interaction_count - 1)
-        if deleted['feedback_value'] > 0:
-            self.model.positive_feedback_count = max(0, self.model.positive_feedback_count - 1)
+        with self._model_lock:
+            self.model.interaction_count = max(0, self.model.interaction_count - 1)
+            if deleted['feedback_value'] > 0:
+                self.model.positive_feedback_count = max(0, self.model.positive_feedback_count - 1)
         
         self.ui.show_success("✅ Interakcja została cofnięta i model przetrenowany!")
 
@@ -272,9 +517,6 @@ class NumberLearningApp:
     
     def _auto_training_mode(self) -> None:
         """Tryb auto-treningu - automatyczne generowanie przykładów z operacjami matematycznymi."""
-        import random
-        import time
-        
         self.ui.show_auto_training_mode_start()
         
         # Zapytaj czy zresetować dane (zalecane dla czystego wzorca)
@@ -282,7 +524,8 @@ class NumberLearningApp:
             self.ui.show_info("🗑️  Resetuję dane i model dla czystego treningu...")
             self.storage.reset_database()
             self.storage.delete_model()
-            self.model = MLModel()
+            with self._model_lock:
+                self.model = MLModel()
             self.stats = Statistics()
             self.ui.show_info("✅ Reset zakończony - czysty start!")
         
@@ -295,63 +538,54 @@ class NumberLearningApp:
         if operation is None:
             return
         
+        # Skompiluj operację raz na cały tryb - błędny zapis zgłaszany od razu, przed generowaniem
+        try:
+            op_fn = self._compile_operation_vec(operation)
+        except (ValueError, SyntaxError) as e:
+            self.ui.show_error(f"Błąd w operacji '{operation}': {e}")
+            return
+        
         # START POMIARU CZASU
         start_time = time.time()
         
-        # Generuj i trenuj
-        training_count = 0
-        
         self.ui.show_info(f"🤖 Rozpoczynam auto-trening: {num_examples} przykładów z operacją '{operation}'")
         
-        for i in range(num_examples):
-            # Generuj losową liczbę z logarytmicznym rozkładem (więcej małych liczb)
-            # 30% szans na liczbę 1-20, 30% na 21-100, 40% na 101-1000
-            rand = random.random()
-            if rand < 0.3:
-                random_input = random.randint(1, 20)
-            elif rand < 0.6:
-                random_input = random.randint(21, 100)
-            else:
-                random_input = random.randint(101, 1000)
-            
-            # Oblicz oczekiwany output według wybranej operacji
-            try:
-                expected_output = self._calculate_operation(random_input, operation)
-            except Exception as e:
-                self.ui.show_error(f"Błąd w operacji '{operation}': {e}")
-                break
-            
-            if expected_output is None or expected_output <= 0:
-                self.ui.show_error(f"Nieprawidłowy wynik operacji dla liczby {random_input}")
-                continue
-            
-            # Zapisz interakcję
-            feedback_value = 1.0  # like - idealne przykłady
-            
-            self.storage.save_interaction(
-                user_input=random_input,
-                model_output=expected_output,
-                expected_output=expected_output,
-                feedback='like',
-                feedback_value=feedback_value,
-                exploration=False
-            )
-            
-            # Aktualizuj model
-            self.model.update(random_input, expected_output, feedback_value)
-            
-            # Aktualizuj statystyki sesji
-            self.stats.update_session(feedback_value)
-            
-            training_count += 1
-            
-            # Pokaż progress co 10 przykładów lub ostatni
-            if (i + 1) % 10 == 0 or (i + 1) == num_examples:
-                self.ui.show_auto_training_progress(i + 1, num_examples, random_input, expected_output)
-            
-            # Auto-save co 20 przykładów
-            if training_count % 20 == 0:
-                self.storage.save_model(self.model)
+        # Generuj wszystkie losowe liczby naraz z logarytmicznym rozkładem (więcej małych liczb)
+        # 30% szans na liczbę 1-20, 30% na 21-100, 40% na 101-1000
+        rng = np.random.default_rng()
+        bucket = rng.choice(3, size=num_examples, p=AUTO_TRAIN_BUCKET_P)
+        inputs = rng.integers(AUTO_TRAIN_BUCKET_LOW[bucket], AUTO_TRAIN_BUCKET_HIGH[bucket])
+        
+        # Oblicz oczekiwane outputy według wybranej operacji (jednym przebiegiem NumPy)
+        outputs = op_fn(inputs)
+        
+        valid = outputs > 0
+        invalid_count = num_examples - int(valid.sum())
+        if invalid_count:
+            self.ui.show_error(f"Nieprawidłowy wynik operacji dla {invalid_count} liczb - pomijam je")
+        
+        inputs = inputs[valid]
+        outputs = outputs[valid]
+        training_count = len(inputs)
+        feedback_values = np.ones(training_count)  # like - idealne przykłady
+        
+        # Zapisuj paczkami po BULK_FLUSH_EVERY przykładów i przesuwaj pasek postępu po każdej paczce
+        progress, task = self.ui.start_auto_training_progress(training_count)
+        with progress:
+            for start in range(0, training_count, BULK_FLUSH_EVERY):
+                chunk_inputs = inputs[start:start + BULK_FLUSH_EVERY].tolist()
+                chunk_outputs = outputs[start:start + BULK_FLUSH_EVERY].tolist()
+                self.storage.save_interactions_bulk([
+                    (inp, out, out, 'like', 1.0, False)
+                    for inp, out in zip(chunk_inputs, chunk_outputs)
+                ])
+                progress.update(task, advance=len(chunk_inputs),
+                                last=f"{chunk_inputs[-1]} → {chunk_outputs[-1]}")
+        
+        # Aktualizuj model i statystyki sesji jednym wywołaniem zamiast N
+        with self._model_lock:
+            self.model.batch_update(inputs, outputs, feedback_values)
+        self.stats.update_session_bulk(feedback_values)
         
         # KONIEC POMIARU CZASU - ONLINE TRAINING
         online_training_time = time.time() - start_time
@@ -365,90 +599,138 @@ class NumberLearningApp:
             
             # POMIAR CZASU BATCH RETRAIN
             batch_start_time = time.time()
-            all_interactions = self.storage.get_all_interactions()
-            self.model.batch_retrain(all_interactions)
+            self._refit_model()
             batch_retrain_time = time.time() - batch_start_time
             
-            self.storage.save_model(self.model)
+            self._save_model_now()
             
             # Całkowity czas
             total_time = time.time() - start_time
             
-            # Pobierz rozmiary plików
-            file_sizes = self.storage.get_file_sizes()
-            
+            # Rozmiary plików UI pobierze sam, dopiero gdy rysuje tabelę
             self.ui.show_training_time_stats(
                 online_time=online_training_time,
                 batch_time=batch_retrain_time,
                 total_time=total_time,
                 num_examples=training_count,
-                file_sizes=file_sizes
+                file_sizes_provider=self.storage.get_file_sizes
             )
     
-    def _calculate_operation(self, number: int, operation: str) -> Optional[int]:
-        """Oblicza wynik operacji matematycznej na liczbie."""
-        try:
-            # Obsługa różnych formatów operacji
-            operation = operation.strip()
+    def _compile_operation(self, operation: str) -> Callable[[int], Optional[int]]:
+        """
+        Parsuje operację raz i zwraca funkcję liczącą jej wynik dla pojedynczej liczby.
+        
+        Wyrażenia z 'x' są liczone dokładnie na intach Pythona (obiekt kodu kompilowany
+        raz). Proste operatory (*2, +100, ^2, ...) idą przez tę samą tablicę
+        _OPERATION_BUILDERS co _compile_operation_vec, dla jednoelementowej tablicy.
+        
+        Args:
+            operation: Operacja matematyczna (np. *2, +100, x*2+1)
             
-            # Jeśli zawiera 'x', użyj eval() dla pełnych wyrażeń (np. x*2+1, x*x+1)
+        Returns:
+            Funkcja number -> wynik (None jeśli wynik nieprawidłowy)
+        """
+        operation = operation.strip()
+        
+        try:
+            # Jeśli zawiera 'x', skompiluj pełne wyrażenie (np. x*2+1, x*x+1)
             if 'x' in operation:
                 # WAŻNE: Zamień ^ na ** (^ to XOR, nie potęgowanie!)
-                operation = operation.replace('^', '**')
+                code = _compile_expression(operation.replace('^', '**'))
                 
-                # Bezpieczny eval z ograniczonym kontekstem
-                safe_dict = {'x': number, '__builtins__': {}}
-                result = eval(operation, safe_dict)
-                return int(result) if isinstance(result, (int, float)) and result > 0 else None
-            
-            # Proste operatory bez 'x':
-            
-            # Mnożenie: *2, *3 itp.
-            if operation.startswith('*'):
-                multiplier = float(operation[1:])
-                return int(number * multiplier)
-            
-            # Dzielenie: /2, /3 itp.
-            elif operation.startswith('/'):
-                divisor = float(operation[1:])
-                if divisor == 0:
-                    return None
-                return int(number / divisor)
-            
-            # Dodawanie: +10, +100 itp.
-            elif operation.startswith('+'):
-                addend = int(operation[1:])
-                return number + addend
-            
-            # Odejmowanie: -10, -50 itp.
-            elif operation.startswith('-'):
-                subtrahend = int(operation[1:])
-                result = number - subtrahend
-                return result if result > 0 else None
-            
-            # Potęga: ^2, **2 itp.
-            elif operation.startswith('^') or operation.startswith('**'):
-                if operation.startswith('**'):
-                    exponent = int(operation[2:])
-                else:
-                    exponent = int(operation[1:])
-                result = number ** exponent
-                # Ogranicz do rozsądnych wartości
-                return int(result) if result < 10**10 else None
-            
-            # Modulo: %10, %100 itp.
-            elif operation.startswith('%'):
-                modulo = int(operation[1:])
-                if modulo == 0:
-                    return None
-                result = number % modulo
-                return result if result > 0 else number  # Jeśli 0, zwróć oryginalną liczbę
-            
+                def apply(number: int) -> Optional[int]:
+                    # Bezpieczny eval z ograniczonym kontekstem
+                    result = eval(code, {'x': number, '__builtins__': {}})
+                    return int(result) if isinstance(result, (int, float)) and result > 0 else None
             else:
+                apply_vec = self._compile_operation_vec(operation)
+                
+                def apply(number: int) -> Optional[int]:
+                    result = int(apply_vec(np.array([number]))[0])
+                    return result if result > 0 else None
+        except Exception:
+            return lambda number: None
+        
+        def safe_apply(number: int) -> Optional[int]:
+            try:
+                return apply(number)
+            except Exception:
                 return None
         
-        except Exception:
-            return None
+        return safe_apply
+    
+    def _compile_operation_vec(self, operation: str) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Parsuje operację raz i zwraca funkcję liczącą jej wynik dla całej tablicy NumPy.
+        
+        Tryby auto-treningu i testowania kompilują operację na starcie i potem
+        tylko wywołują gotową funkcję.
+        
+        Args:
+            operation: Operacja matematyczna (np. *2, +100, x*2+1)
+            
+        Returns:
+            Funkcja tablica -> tablica int64 z wynikami (0 = nieprawidłowy wynik)
+            
+        Raises:
+            ValueError: Operacja jest niepoprawnie zapisana (np. '*abc', '?5')
+            SyntaxError: Wyrażenie z 'x' nie daje się sparsować
+        """
+        operation = operation.strip()
+        
+        if 'x' in operation:
+            # WAŻNE: Zamień ^ na ** (^ to XOR, nie potęgowanie!)
+            expression = operation.replace('^', '**')
+            code = _compile_expression(expression)
+            kernel = None
+            if numba is not None:
+                try:
+                    kernel = _compile_numba_kernel(expression)
+                except Exception:
+                    kernel = None  # Wyrażenie nieobsługiwane przez Numba - zostaje NumPy
+            
+            exact = self._compile_operation(operation)
+            
+            def apply_expression(numbers: np.ndarray) -> np.ndarray:
+                floats = numbers.astype(np.float64)
+                result = None
+                if kernel is not None:
+                    try:
+                        result = kernel(floats)
+                    except Exception:
+                        result = None  # Np. dzielenie przez 0 - policz NumPy poniżej
+                if result is None:
+                    result = np.asarray(eval(code, {'x': floats, '__builtins__': {}}))
+                if result.dtype.kind not in 'iuf':
+                    return _invalid_operation(numbers)
+                result = np.broadcast_to(result, numbers.shape)
+                # float64 jest dokładny tylko do 2^53 - resztę (i inf/nan) policz dokładnie na int
+                imprecise = ~(np.abs(result) < 2.0**53)
+                result = np.where(imprecise, 0, result).astype(np.int64)
+                for i in np.flatnonzero(imprecise):
+                    value = exact(int(numbers[i]))
+                    # Wyniki poza zakresem int64 (i tak nie zmieszczą się w SQLite) są nieprawidłowe
+                    if value is not None and value < 2**63:
+                        result[i] = value
+                return result
+            
+            apply = apply_expression
+        else:
+            builder = _OPERATION_BUILDERS.get(operation[:1])
+            if builder is None:
+                raise ValueError(f"Nieznana operacja: '{operation}'")
+            apply = builder(operation[1:])
+        
+        def safe_apply(numbers: np.ndarray) -> np.ndarray:
+            numbers = np.asarray(numbers, dtype=np.int64)
+            with np.errstate(all='ignore'):
+                try:
+                    result = apply(numbers)
+                except Exception:
+                    return _invalid_operation(numbers)
+            return np.where(result > 0, result, 0).astype(np.int64)
+        
+        return safe_apply
     
     def _training_mode(self) -> None:
         """Tryb treningu - użytkownik kontroluje input i output."""
@@ -508,7 +790,8 @@ class NumberLearningApp:
             )
             
             # Aktualizuj model
-            self.model.update(user_input, user_output, feedback_value)
+            with self._model_lock:
+                self.model.update(user_input, user_output, feedback_value)
             
             # Aktualizuj statystyki sesji
             self.stats.update_session(feedback_value)
@@ -518,9 +801,8 @@ class NumberLearningApp:
             
             training_count += 1
             
-            # Auto-save co 5 przykładów
-            if training_count % 5 == 0:
-                self.storage.save_model(self.model)
+            # Zapis modelu w tle (zbiera serię zmian w jeden zapis)
+            self._model_dirty.set()
         
         # Podsumowanie
         self.ui.show_training_mode_end(training_count)
@@ -528,16 +810,12 @@ class NumberLearningApp:
         # PRZETRENUJĘ model na wszystkich danych (offline learning)
         if training_count > 0:
             self.ui.show_info("🔄 Optymalizuję model na podstawie wszystkich danych...")
-            all_interactions = self.storage.get_all_interactions()
-            self.model.batch_retrain(all_interactions)
-            self.storage.save_model(self.model)
+            self._refit_model()
+            self._save_model_now()
             self.ui.show_info("✅ Model zoptymalizowany i zapisany!")
     
     def _testing_model_mode(self) -> None:
         """Tryb testowania modelu - automatyczne testowanie na losowych przykładach."""
-        import random
-        import time
-        
         self.ui.show_testing_mode_start()
         
         # Pobierz parametry od użytkownika
@@ -549,88 +827,70 @@ class NumberLearningApp:
         if operation is None:
             return
         
+        # Skompiluj operację raz na cały tryb - błędny zapis zgłaszany od razu, przed generowaniem
+        try:
+            op_fn = self._compile_operation_vec(operation)
+        except (ValueError, SyntaxError) as e:
+            self.ui.show_error(f"Błąd w operacji '{operation}': {e}")
+            return
+        
         # START POMIARU CZASU
         start_time = time.time()
         
-        # Statystyki testowania
-        correct_predictions = 0
-        total_tests = 0
-        test_results = []
-        
         self.ui.show_info(f"🧪 Rozpoczynam testowanie: {num_tests} przykładów z wzorcem '{operation}'")
         
-        for i in range(num_tests):
-            # Generuj losową liczbę (od 1 do 1000)
-            random_input = random.randint(1, 1000)
-            
-            # Oblicz prawidłową odpowiedź według wzorca
-            try:
-                correct_answer = self._calculate_operation(random_input, operation)
-            except Exception as e:
-                self.ui.show_error(f"Błąd w operacji '{operation}': {e}")
-                break
-            
-            if correct_answer is None or correct_answer <= 0:
-                continue
-            
-            # AI przewiduje odpowiedź
-            ai_prediction, is_exploration = self.model.predict(random_input)
-            
-            # Sprawdź czy AI zgadło
-            is_correct = (ai_prediction == correct_answer)
-            
-            # Określ feedback
-            if is_correct:
-                feedback = 'like'
-                feedback_value = 1.0
-                correct_predictions += 1
-            else:
-                feedback = 'dislike'
-                feedback_value = 0.0
-            
-            # Zapisz interakcję
-            self.storage.save_interaction(
-                user_input=random_input,
-                model_output=ai_prediction,
-                expected_output=correct_answer,
-                feedback=feedback,
-                feedback_value=feedback_value,
-                exploration=is_exploration
-            )
-            
-            # Aktualizuj model (uczy się z poprawnej odpowiedzi)
-            self.model.update(random_input, correct_answer, feedback_value)
-            
-            # Aktualizuj statystyki sesji
-            self.stats.update_session(feedback_value)
-            
-            total_tests += 1
-            
-            # Zachowaj wynik do statystyk
-            test_results.append({
-                'input': random_input,
-                'ai_prediction': ai_prediction,
-                'correct_answer': correct_answer,
-                'is_correct': is_correct,
-                'is_exploration': is_exploration
-            })
-            
-            # Pokaż progress co 10 przykładów lub ostatni
-            if (i + 1) % 10 == 0 or (i + 1) == num_tests:
-                accuracy = (correct_predictions / total_tests * 100) if total_tests > 0 else 0
-                self.ui.show_testing_progress(
-                    i + 1, 
-                    num_tests, 
-                    random_input, 
-                    ai_prediction, 
-                    correct_answer, 
-                    is_correct,
-                    accuracy
-                )
-            
-            # Auto-save co 20 przykładów
-            if total_tests % 20 == 0:
-                self.storage.save_model(self.model)
+        # Generuj wszystkie losowe liczby naraz (od 1 do 1000) i policz prawidłowe odpowiedzi
+        inputs = np.random.default_rng().integers(1, 1001, num_tests)
+        answers = op_fn(inputs)
+        
+        # Testy, dla których operacja nie daje prawidłowego wyniku, są pomijane - z informacją ile
+        valid = answers > 0
+        skipped_tests = num_tests - int(valid.sum())
+        if skipped_tests:
+            self.ui.show_error(f"Nieprawidłowy wynik operacji dla {skipped_tests} liczb - pomijam te testy")
+        
+        inputs = inputs[valid]
+        answers = answers[valid]
+        total_tests = len(inputs)
+        
+        # AI przewiduje odpowiedzi dla całej serii i sprawdzamy które zgadło
+        predictions, explorations = self.model.predict_many(inputs)
+        correct = predictions == answers
+        correct_predictions = int(correct.sum())
+        feedback_values = correct.astype(np.float64)
+        
+        # Zapisz interakcje paczkami i aktualizuj linię postępu co 10 przykładów lub na ostatnim
+        running_correct = np.cumsum(correct)
+        live = self.ui.start_testing_progress()
+        with live:
+            for start in range(0, total_tests, BULK_FLUSH_EVERY):
+                end = min(start + BULK_FLUSH_EVERY, total_tests)
+                self.storage.save_interactions_bulk([
+                    (inp, pred, ans, 'like' if fv else 'dislike', fv, expl)
+                    for inp, pred, ans, fv, expl in zip(
+                        inputs[start:end].tolist(), predictions[start:end].tolist(),
+                        answers[start:end].tolist(), feedback_values[start:end].tolist(),
+                        explorations[start:end].tolist()
+                    )
+                ])
+                
+                for i in range(start, end):
+                    if (i + 1) % 10 == 0 or (i + 1) == total_tests:
+                        self.ui.update_testing_progress(
+                            live,
+                            i + 1, 
+                            total_tests, 
+                            int(inputs[i]), 
+                            int(predictions[i]), 
+                            int(answers[i]), 
+                            bool(correct[i]),
+                            running_correct[i] / (i + 1) * 100
+                        )
+        
+        # Aktualizuj model (uczy się z poprawnych odpowiedzi) i statystyki sesji jednym wywołaniem
+        with self._model_lock:
+            self.model.batch_update(inputs, answers, feedback_values)
+        self.stats.update_session_bulk(feedback_values)
         
         # KONIEC TESTOWANIA
         testing_time = time.time() - start_time
@@ -644,12 +904,13 @@ class NumberLearningApp:
             correct_predictions, 
             final_accuracy, 
             operation, 
-            testing_time
+            testing_time,
+            skipped_tests
         )
         
         # Zapisz model po testowaniu
         if total_tests > 0:
-            self.storage.save_model(self.model)
+            self._save_model_now()
             self.ui.show_info("✅ Model zaktualizowany i zapisany!")
     
     def _main_interaction_loop(self) -> None:
@@ -686,11 +947,7 @@ class NumberLearningApp:
                 break
             
             # 6. Mapuj feedback na wartość numeryczną
-            feedback_values = {
-                'dislike': 0.0,  # Błędna odpowiedź
-                'like': 1.0      # Idealna odpowiedź
-            }
-            feedback_value = feedback_values[feedback]
+            feedback_value = FEEDBACK_VALUES[feedback]
             
             # 6a. Jeśli dislike, zapytaj o oczekiwaną odpowiedź
             # Like = idealnie, używamy tego co model zwrócił
@@ -715,7 +972,8 @@ class NumberLearningApp:
             )
             
             # 8. Aktualizuj model z OCZEKIWANYM outputem
-            self.model.update(number, expected_output, feedback_value)
+            with self._model_lock:
+                self.model.update(number, expected_output, feedback_value)
             
             # 9. Aktualizuj statystyki sesji
             self.stats.update_session(feedback_value)
@@ -727,15 +985,14 @@ class NumberLearningApp:
             model_stats = self.model.get_stats()
             self.ui.show_quick_stats(db_stats, model_stats)
             
-            # 11. Automatyczny retrain co 10 interakcji (uczenie na bieżąco)
+            # 11. Automatyczny retrain co 10 interakcji (uczenie na bieżąco).
+            # Równania normalne są już zaktualizowane przez update() - wystarczy je rozwiązać.
             if self.stats.session_interactions % 10 == 0:
-                all_interactions = self.storage.get_all_interactions()
-                self.model.batch_retrain(all_interactions)
+                self._refit_model()
                 self.ui.show_info("🔄 Model automatycznie przetrenowany na wszystkich danych!")
             
-            # 12. Okresowo zapisuj model (co 5 interakcji)
-            if self.stats.session_interactions % 5 == 0:
-                self.storage.save_model(self.model)
+            # 12. Oznacz model do zapisu - wątek w tle zapisze go najwyżej raz na MODEL_SAVE_DEBOUNCE s
+            self._model_dirty.set()
     
     def run(self) -> None:
         """Główna metoda uruchomieniowa aplikacji."""
@@ -752,8 +1009,10 @@ class NumberLearningApp:
             self.ui.console.print("\n")
         
         finally:
-            # Zapisz model przed wyjściem
-            self.storage.save_model(self.model)
+            # Zatrzymaj zapis w tle i zapisz model przed wyjściem (zanim baza zostanie zamknięta)
+            self._stop_model_saver()
+            self._save_model_now()
+            self.storage.close()
             
             # Pożegnanie
             self.ui.show_goodbye()
@@ -761,7 +1020,12 @@ class NumberLearningApp:
 
 def main():
     """Entry point aplikacji."""
-    app = NumberLearningApp()
+    parser = argparse.ArgumentParser(description="Number Learning AI - interaktywna aplikacja konsolowa z ML")
+    parser.add_argument("--silent-progress", action="store_true",
+                        help="w trybie testowania pokaż tylko wynik końcowy, bez postępu po każdej paczce testów")
+    args = parser.parse_args()
+    
+    app = NumberLearningApp(verbose_progress=not args.silent_progress)
     app.run()
 
 
@@ -0,0 +1,93 @@
+"""
+Kernele numeryczne modelu - równania normalne i ewaluacja wielomianu stopnia 3.
+
+Gdy zainstalowana jest Numba, kernele są kompilowane (@njit) do jednej pętli
+w kodzie maszynowym, bez tablic pośrednich. Bez Numby używane są odpowiedniki w NumPy.
+
+Wszystko liczone jest w float64: sumy potęg sięgają Σx⁶ (~10¹⁸ już przy x~1000),
+a float32 (24 bity mantysy) gubi przy nich tyle, że nawet x*2+1 przestaje
+wychodzić dokładnie (błąd predykcji ~0.1) i nie działa wykrywanie całkowitych wzorów.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba jest opcjonalna - bez niej kernele liczone są zwykłym NumPy
+    numba = None
+
+
+def _normal_equations_numpy(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    features = np.vander(x, 4, increasing=True)  # [1, x, x², x³]
+    return features.T @ features, features.T @ y
+
+
+def _eval_poly3_numpy(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    c0, c1, c2, c3 = coefficients
+    return ((c3 * x + c2) * x + c1) * x + c0
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _normal_equations_numba(x, y):
+        # Jedno przejście po danych: sumy potęg Σxⁿ (n=0..6) i Σy·xᵏ (k=0..3)
+        power_sums = np.zeros(7)
+        xty = np.zeros(4)
+        for i in range(x.size):
+            power = 1.0
+            for k in range(7):
+                power_sums[k] += power
+                if k < 4:
+                    xty[k] += y[i] * power
+                power *= x[i]
+
+        # XᵀX to macierz Hankela z sum potęg: (XᵀX)[i, j] = Σx^(i+j)
+        xtx = np.empty((4, 4))
+        for i in range(4):
+            for j in range(4):
+                xtx[i, j] = power_sums[i + j]
+        return xtx, xty
+
+    @numba.njit(cache=True)
+    def _eval_poly3_numba(coefficients, x):
+        c0, c1, c2, c3 = coefficients[0], coefficients[1], coefficients[2], coefficients[3]
+        result = np.empty(x.size)
+        for i in range(x.size):
+            result[i] = ((c3 * x[i] + c2) * x[i] + c1) * x[i] + c0
+        return result
+
+
+def normal_equations(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Liczy równania normalne XᵀX i Xᵀy dla cech [1, x, x², x³].
+
+    Args:
+        x: Tablica inputów (float64)
+        y: Tablica oczekiwanych outputów (float64)
+
+    Returns:
+        Tuple (XᵀX o kształcie 4x4, Xᵀy o długości 4)
+    """
+    if numba is not None:
+        return _normal_equations_numba(np.ascontiguousarray(x, dtype=np.float64),
+                                       np.ascontiguousarray(y, dtype=np.float64))
+    return _normal_equations_numpy(x, y)
+
+
+def eval_poly3(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Liczy a₀ + a₁x + a₂x² + a₃x³ schematem Hornera dla całej tablicy.
+
+    Args:
+        coefficients: Współczynniki [a₀, a₁, a₂, a₃]
+        x: Tablica inputów (float64)
+
+    Returns:
+        Tablica wartości wielomianu (float64)
+    """
+    if numba is not None:
+        return _eval_poly3_numba(np.ascontiguousarray(coefficients, dtype=np.float64),
+                                 np.ascontiguousarray(x, dtype=np.float64))
+    return _eval_poly3_numpy(coefficients, x)
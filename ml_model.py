@@ -6,12 +6,25 @@ mnożeniem, dodawaniem, potęgowaniem (x², x³) i ich kombinacjami.
 Osiąga 0% błędu dla operacji matematycznych typu x*2, x+100, x², x*2+1, itp.
 """
 
+import bisect
 import numpy as np
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.linear_model import LinearRegression
-from sklearn.pipeline import Pipeline
 import random
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
+
+from interaction_buffer import InteractionBuffer
+from ml_kernels import normal_equations, eval_poly3
+
+
+# Strategie eksploracji - progi skumulowanych szans: 35% / 30% / 20% / reszta 15%
+EXPLORATION_STRATEGY_CDF = (0.35, 0.65, 0.85)
+
+# Mnożniki i przesunięcia losowane przez eksplorację
+EXPLORATION_MULTIPLIERS = (2, 3, 4, 5, 10, 20, 50)
+EXPLORATION_OFFSETS = (10, 25, 50, 100, 200, 500, 1000)
+
+# Maksymalny współczynnik uwarunkowania (przeskalowanych) równań normalnych - powyżej
+# układ traktowany jest jako osobliwy i model schodzi do niższego stopnia wielomianu
+MAX_CONDITION_NUMBER = 1e14
 
 
 class MLModel:
@@ -42,13 +55,20 @@ class MLModel:
         self.epsilon_decay = epsilon_decay
         self.output_range = output_range
         
-        # Model Polynomial Regression (stopień 3)
-        # Generuje cechy: [1, x, x², x³] i uczy się liniowej kombinacji
+        # Równania normalne dla cech [1, x, x², x³] z pozytywnych przykładów: XᵀX i Xᵀy.
+        # Z nich liczone są współczynniki (rozwiązanie w zamkniętej postaci) - można je
+        # też cofnąć o pojedynczy przykład (downdate) bez trenowania od zera.
+        self._xtx = np.zeros((4, 4))
+        self._xty = np.zeros(4)
+        self.moment_count = 0
+        # Znacznik danych z bazy (DataStorage.data_version), z których zbudowano równania
+        # normalne - None, gdy nie wiadomo (np. nowy model albo starszy zapis)
+        self.data_version: Optional[int] = None
+        
+        # Model Polynomial Regression (stopień 3): współczynniki [a₀, a₁, a₂, a₃]
+        # dla cech [1, x, x², x³] - y = a₀ + a₁x + a₂x² + a₃x³
         # Może perfekcyjnie nauczyć się: x*k, x+k, x², x³, x*2+1, itp.
-        self.model = Pipeline([
-            ('poly', PolynomialFeatures(degree=3, include_bias=True)),
-            ('linear', LinearRegression())
-        ])
+        self._set_coefficients(np.zeros(4))
         
         # Tracking
         self.is_fitted = False
@@ -58,24 +78,31 @@ class MLModel:
         # Historia ostatnich predykcji dla "explain"
         self.last_prediction_info: Optional[dict] = None
     
-    def _extract_features(self, user_input: int) -> np.ndarray:
+    def __setstate__(self, state: dict) -> None:
         """
-        Przygotowuje input dla Polynomial Regression.
+        Odtwarza model z pickle - także ze starych plików, w których model był
+        pipeline'em sklearn (PolynomialFeatures + LinearRegression).
+        """
+        legacy_model = state.pop('model', None)
+        self.__dict__.update(state)
         
-        Polynomial Regression sam generuje cechy wielomianowe:
-        - PolynomialFeatures(degree=3) tworzy: [1, x, x², x³]
-        - Model uczy się: y = a₀ + a₁x + a₂x² + a₃x³
+        if '_xtx' not in state:
+            self._xtx = np.zeros((4, 4))
+            self._xty = np.zeros(4)
+            self.moment_count = 0
         
-        Nie potrzebujemy ręcznie tworzyć cech - model robi to automatycznie!
+        if 'data_version' not in state:
+            self.data_version = None
         
-        Args:
-            user_input: Liczba podana przez użytkownika
-            
-        Returns:
-            Array z samym x (shape: [1, 1]) - Polynomial Regression sam doda cechy
-        """
-        x = float(user_input)
-        return np.array([[x]], dtype=np.float64)
+        if 'coeffs_' not in state:
+            self._set_coefficients(np.zeros(4))
+            try:
+                linear = legacy_model.named_steps['linear']
+                self._set_coefficients([float(linear.intercept_) + float(linear.coef_[0]),
+                                        linear.coef_[1], linear.coef_[2], linear.coef_[3]])
+            except (AttributeError, KeyError, IndexError, TypeError):
+                # Bardzo stare modele (inny estymator niż Pipeline) - nie da się ich przenieść
+                self.is_fitted = False
     
     def _get_exploration_output(self, user_input: int) -> int:
         """
@@ -87,19 +114,22 @@ class MLModel:
         - 20% szans: dodawanie/odejmowanie (±10 do ±1000)
         - 15% szans: losowo z inteligentnego zakresu
         """
-        strategy = random.random()
+        output_max = self.output_range[1]
         
-        if strategy < 0.35:
+        # Jedno losowanie + wyszukiwanie binarne w progach zamiast łańcucha porównań
+        strategy = bisect.bisect_right(EXPLORATION_STRATEGY_CDF, random.random())
+        
+        if strategy == 0:
             # Wielokrotności - najczęstsze wzorce (NIE 0.5, zawsze >= input)
-            multiplier = random.choice([2, 3, 4, 5, 10, 20, 50])
+            multiplier = random.choice(EXPLORATION_MULTIPLIERS)
             output = user_input * multiplier
-        elif strategy < 0.65:
+        elif strategy == 1:
             # Blisko inputu ale z większym zakresem (zawsze >= input/2)
             factor = random.uniform(0.5, 3.0)
             output = int(user_input * factor)
-        elif strategy < 0.85:
+        elif strategy == 2:
             # Stałe przesunięcia
-            offset = random.choice([10, 25, 50, 100, 200, 500, 1000])
+            offset = random.choice(EXPLORATION_OFFSETS)
             # 50% szans dodać, 50% odjąć (ale nie mniej niż 1)
             if random.random() < 0.5:
                 output = user_input + offset
@@ -108,13 +138,49 @@ class MLModel:
         else:
             # Losowo z rozsądnego zakresu
             min_val = max(1, user_input // 2)
-            max_val = min(self.output_range[1], user_input * 50)
+            max_val = min(output_max, user_input * 50)
             output = random.randint(min_val, max_val)
         
         # Ogranicz do dozwolonego zakresu (minimum 1)
-        output = max(1, min(self.output_range[1], output))
+        output = max(1, min(output_max, output))
         return output
     
+    def _get_exploration_batch(self, user_inputs: np.ndarray) -> np.ndarray:
+        """
+        Wektorowa wersja _get_exploration_output() - losowe outputy dla całej tablicy inputów.
+        
+        Każdy element losuje strategię niezależnie, z tymi samymi szansami i zakresami.
+        
+        Args:
+            user_inputs: Tablica inputów (int64)
+            
+        Returns:
+            Tablica outputów (int64) w zakresie [1, output_range[1]]
+        """
+        user_inputs = np.asarray(user_inputs, dtype=np.int64)
+        n = len(user_inputs)
+        rng = np.random.default_rng()
+        max_output = self.output_range[1]
+        
+        strategy = np.searchsorted(EXPLORATION_STRATEGY_CDF, rng.random(n), side='right')
+        
+        # Wielokrotności
+        multiplied = user_inputs * rng.choice(EXPLORATION_MULTIPLIERS, n)
+        # Blisko inputu (50% do 300%)
+        scaled = (user_inputs * rng.uniform(0.5, 3.0, n)).astype(np.int64)
+        # Stałe przesunięcia - 50% szans dodać, 50% odjąć (ale nie mniej niż 1)
+        offsets = rng.choice(EXPLORATION_OFFSETS, n)
+        shifted = np.where(rng.random(n) < 0.5, user_inputs + offsets, np.maximum(1, user_inputs - offsets))
+        # Losowo z rozsądnego zakresu
+        low = np.maximum(1, user_inputs // 2)
+        high = np.maximum(low, np.minimum(max_output, user_inputs * 50))
+        ranged = rng.integers(low, high + 1)
+        
+        output = np.choose(strategy, [multiplied, scaled, shifted, ranged])
+        
+        # Ogranicz do dozwolonego zakresu (minimum 1)
+        return np.clip(output, 1, max_output)
+    
     def predict(self, user_input: int) -> Tuple[int, bool]:
         """
         Przewiduje output dla danego inputu (z epsilon-greedy).
@@ -142,8 +208,16 @@ class MLModel:
             return output, True
         else:
             # EKSPLOATACJA - użyj modelu
-            x_features = self._extract_features(user_input)
-            predicted = self.model.predict(x_features)[0]
+            # Schemat Hornera na zapamiętanych współczynnikach - same operacje na floatach.
+            # _c0.._c3 to zwykłe floaty Pythona (nie skalary NumPy), więc predicted też -
+            # porównania i round() poniżej nie przechodzą przez dispatch NumPy.
+            if self._int_coeffs is not None:
+                # Model nauczył się wzoru o całkowitych współczynnikach (np. 2x+1) - licz na intach
+                c0, c1, c2, c3 = self._int_coeffs
+                predicted = ((c3 * user_input + c2) * user_input + c1) * user_input + c0
+            else:
+                x = float(user_input)
+                predicted = ((self._c3 * x + self._c2) * x + self._c1) * x + self._c0
             
             # Jeśli predykcja jest zbyt mała i mamy mało danych, użyj heurystyki
             if predicted < user_input * 0.3 and self.positive_feedback_count < 5:
@@ -172,6 +246,71 @@ class MLModel:
             
             return output, False
     
+    def predict_many(self, user_inputs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Wektorowa wersja predict() dla serii inputów (np. w trybie testowania).
+        
+        Zakłada, że po każdej predykcji nastąpi update() - epsilon dla i-tego inputu
+        to max(epsilon_min, epsilon * decay^i), tak jak przy N kolejnych wywołaniach.
+        Sam epsilon modelu nie jest tu zmieniany (robi to update/batch_update).
+        
+        Args:
+            user_inputs: Tablica liczb podanych do predykcji
+            
+        Returns:
+            Tuple (tablica predykcji int64, maska eksploracji bool)
+        """
+        user_inputs = np.asarray(user_inputs, dtype=np.int64)
+        n = len(user_inputs)
+        outputs = np.empty(n, dtype=np.int64)
+        
+        # Epsilon-greedy decision dla całej serii naraz
+        epsilons = np.maximum(self.epsilon_min, self.epsilon * self.epsilon_decay ** np.arange(n))
+        explore = np.random.random(n) < epsilons
+        if not self.is_fitted:
+            explore[:] = True
+        
+        # EKSPLOATACJA - jedno wywołanie modelu dla wszystkich inputów
+        exploit = ~explore
+        if exploit.any():
+            x = user_inputs[exploit]
+            predicted = eval_poly3(self.coeffs_, x.astype(np.float64))
+            
+            # Zaokrąglij i ogranicz do zakresu (predykcja < 1 -> input)
+            rounded = np.rint(predicted)
+            rounded = np.where(rounded < 1, np.maximum(1, x), rounded)
+            rounded = np.minimum(self.output_range[1], rounded)
+            
+            # Heurystyka (input * 2) gdy predykcja jest zbyt mała przy małej liczbie danych
+            if self.positive_feedback_count < 5:
+                rounded = np.where(predicted < x * 0.3, x * 2, rounded)
+            
+            outputs[exploit] = rounded.astype(np.int64)
+        
+        # EKSPLORACJA - losowe outputy dla wylosowanych pozycji, jednym przebiegiem
+        if explore.any():
+            outputs[explore] = self._get_exploration_batch(user_inputs[explore])
+        
+        if n:
+            if explore[-1]:
+                self.last_prediction_info = {
+                    'mode': 'exploration',
+                    'epsilon': float(epsilons[-1]),
+                    'confidence': 0.0,
+                    'reason': 'Eksploracja - szukam nowych wzorców' if self.is_fitted else 'Brak danych - uczę się'
+                }
+            else:
+                confidence = min(0.95, self.positive_feedback_count / max(10, self.interaction_count))
+                self.last_prediction_info = {
+                    'mode': 'exploitation',
+                    'epsilon': float(epsilons[-1]),
+                    'confidence': confidence,
+                    'reason': f'Predykcja modelu Polynomial Regression (pewność: {confidence:.1%})',
+                    'raw_prediction': float(predicted[-1])
+                }
+        
+        return outputs, explore
+    
     def update(self, user_input: int, expected_output: int, feedback_value: float) -> None:
         """
         Aktualizuje statystyki na podstawie feedbacku.
@@ -189,11 +328,36 @@ class MLModel:
         # Śledź pozytywny feedback
         if feedback_value > 0:
             self.positive_feedback_count += 1
+            self._accumulate_moments(np.array([float(user_input)]), np.array([float(expected_output)]))
         
         # Decay epsilon - z czasem mniej eksploracji
         self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
     
-    def batch_retrain(self, interactions: list) -> None:
+    def batch_update(self, user_inputs: np.ndarray, expected_outputs: np.ndarray,
+                     feedback_values: np.ndarray) -> None:
+        """
+        Wektorowy odpowiednik wielokrotnego wywołania update() - jedna operacja dla całej paczki.
+        
+        Epsilon maleje tak samo jak po N pojedynczych aktualizacjach (epsilon * decay^N).
+        
+        Args:
+            user_inputs: Tablica inputów
+            expected_outputs: Tablica oczekiwanych outputów
+            feedback_values: Tablica wartości feedbacku (0.0=dislike, 1.0=like)
+        """
+        n = len(feedback_values)
+        if n == 0:
+            return
+        
+        positive = np.asarray(feedback_values) > 0
+        
+        self.interaction_count += n
+        self.positive_feedback_count += int(np.count_nonzero(positive))
+        self._accumulate_moments(np.asarray(user_inputs, dtype=np.float64)[positive],
+                                 np.asarray(expected_outputs, dtype=np.float64)[positive])
+        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay ** n)
+    
+    def batch_retrain(self, interactions: Union[list, InteractionBuffer]) -> None:
         """
         Przetrening modelu na wszystkich danych historycznych.
         
@@ -202,24 +366,217 @@ class MLModel:
         
         Args:
             interactions: Lista tupli (user_input, expected_output, feedback_value)
+                          albo InteractionBuffer (kolumny trafiają do treningu bez kopiowania)
         """
+        if isinstance(interactions, InteractionBuffer):
+            self.batch_retrain_arrays(interactions.inputs, interactions.outputs, interactions.feedback)
+            return
+        
         if not interactions:
             return
         
+        # Jedna konwersja listy tupli do tablicy (N, 3) zamiast osobnych list dla kolumn
+        data = np.asarray(interactions, dtype=np.float64)
+        self.batch_retrain_arrays(data[:, 0], data[:, 1], data[:, 2])
+    
+    def batch_retrain_arrays(self, user_inputs: np.ndarray, expected_outputs: np.ndarray,
+                             feedback_values: np.ndarray) -> None:
+        """
+        Przetrening modelu na danych podanych jako równoległe tablice NumPy.
+        
+        Args:
+            user_inputs: Tablica inputów
+            expected_outputs: Tablica oczekiwanych outputów
+            feedback_values: Tablica wartości feedbacku
+        """
         # Filtruj tylko pozytywne przykłady (like - fb > 0)
-        positive_interactions = [(inp, out, fb) for inp, out, fb in interactions if fb > 0]
+        positive = np.asarray(feedback_values) > 0
+        
+        if not positive.any():
+            return
+        
+        x = np.asarray(user_inputs, dtype=np.float64)[positive]
+        y = np.asarray(expected_outputs, dtype=np.float64)[positive]
+        
+        # Zbuduj równania normalne od zera i rozwiąż je (4x4) - bez iteracyjnego treningu
+        self._xtx = np.zeros((4, 4))
+        self._xty = np.zeros(4)
+        self.moment_count = 0
+        self._accumulate_moments(x, y)
+        self._set_coefficients(self._solve_moments())
+        
+        self.is_fitted = True
+    
+    def _accumulate_moments(self, x: np.ndarray, y: np.ndarray, sign: float = 1.0) -> None:
+        """
+        Dodaje (sign=1) lub odejmuje (sign=-1) wkład przykładów do XᵀX i Xᵀy.
         
-        if not positive_interactions:
+        Args:
+            x: Tablica inputów (float64)
+            y: Tablica oczekiwanych outputów (float64)
+            sign: 1.0 przy dodawaniu, -1.0 przy cofaniu przykładów
+        """
+        if len(x) == 0:
             return
         
-        # Przygotuj dane - tylko surowe x (Polynomial Regression sam doda cechy)
-        X = np.array([[float(inp)] for inp, _, _ in positive_interactions], dtype=np.float64)
-        y = np.array([out for _, out, _ in positive_interactions], dtype=np.float64)
+        xtx, xty = normal_equations(x, y)
+        self._xtx += sign * xtx
+        self._xty += sign * xty
+        self.moment_count += int(sign) * len(x)
+    
+    def downdate(self, user_input: int, expected_output: int, feedback_value: float) -> bool:
+        """
+        Cofa wkład jednego przykładu i przelicza współczynniki z równań normalnych (O(1)).
         
-        # Polynomial Regression - trenuj pipeline (PolynomialFeatures + LinearRegression)
-        self.model.fit(X, y)
+        Wynik odpowiada przetrenowaniu modelu na wszystkich pozostałych pozytywnych
+        przykładach, ale bez ponownego czytania całej historii.
         
+        Args:
+            user_input: Input cofanego przykładu
+            expected_output: Oczekiwany output cofanego przykładu
+            feedback_value: Wartość feedbacku cofanego przykładu
+            
+        Returns:
+            True jeśli się udało, False jeśli potrzebny jest pełny batch_retrain
+            (np. model zapisany przed dodaniem równań normalnych)
+        """
+        if not self.is_fitted:
+            return False
+        
+        # Negatywne przykłady nie biorą udziału w treningu
+        if feedback_value <= 0:
+            return True
+        
+        self._accumulate_moments(np.array([float(user_input)]), np.array([float(expected_output)]), sign=-1.0)
+        
+        # Bez pozytywnych przykładów batch_retrain też nie zmieniłby współczynników
+        if self.moment_count > 0:
+            self._set_coefficients(self._solve_moments())
+        
+        return True
+    
+    def refit_from_moments(self) -> bool:
+        """
+        Przelicza współczynniki z zakumulowanych równań normalnych (O(1)).
+        
+        Równania są dopisywane na bieżąco przez update()/batch_update(), więc daje to
+        ten sam wynik co batch_retrain() na wszystkich pozytywnych przykładach -
+        o ile moment_count zgadza się z liczbą pozytywnych przykładów w bazie.
+        
+        Returns:
+            True jeśli się udało, False jeśli potrzebny jest pełny batch_retrain
+        """
+        if self.moment_count == 0:
+            return False
+        
+        self._set_coefficients(self._solve_moments())
         self.is_fitted = True
+        return True
+    
+    def _solve_moments(self) -> np.ndarray:
+        """
+        Rozwiązuje równania normalne XᵀX·c = Xᵀy dla współczynników [a₀, a₁, a₂, a₃].
+        
+        Kolumny są skalowane przez sqrt(diag(XᵀX)) - bez tego x³ (do ~10⁹) i 1
+        dają macierz tak źle uwarunkowaną, że wynik traci precyzję.
+        
+        Przy mniej niż 4 różnych inputach (albo inputach bardzo blisko siebie) pełny
+        układ jest osobliwy - wtedy dopasowywany jest wielomian niższego stopnia
+        (brakujące współczynniki = 0), zamiast losowego rozwiązania układu osobliwego.
+        """
+        scale = np.sqrt(np.diag(self._xtx))
+        scale[scale == 0] = 1.0
+        scaled_xtx = self._xtx / np.outer(scale, scale)
+        scaled_xty = self._xty / scale
+        
+        coefficients = np.zeros(4)
+        for size in range(4, 0, -1):
+            block = scaled_xtx[:size, :size]
+            if np.linalg.cond(block) < MAX_CONDITION_NUMBER:
+                coefficients[:size] = np.linalg.solve(block, scaled_xty[:size]) / scale[:size]
+                break
+        
+        return coefficients
+    
+    def _set_coefficients(self, coefficients: np.ndarray) -> None:
+        """Ustawia współczynniki [a₀, a₁, a₂, a₃] używane przy predykcji."""
+        self.coeffs_ = np.array(coefficients, dtype=np.float64)
+        # Kopie jako zwykłe floaty (tolist(), nie skalary NumPy) - predict() liczy na nich schematem Hornera
+        self._c0, self._c1, self._c2, self._c3 = self.coeffs_.tolist()
+        self._int_coeffs = self._integer_coefficients()
+    
+    def _integer_coefficients(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Sprawdza, czy wyuczony wielomian ma (z dokładnością numeryczną) całkowite współczynniki.
+        
+        Błąd zaokrąglenia współczynników jest mierzony na danych treningowych:
+        Σ|aₖ - round(aₖ)|·RMS(xᵏ) ogranicza różnicę predykcji, więc x³ przy x~1000
+        nie ukryje się za małym błędem samego a₃.
+        
+        Returns:
+            Tuple intów (a₀, a₁, a₂, a₃) albo None, jeśli wzór nie jest całkowity
+        """
+        if self.moment_count == 0:
+            return None
+        
+        rounded = np.rint(self.coeffs_)
+        rms_powers = np.sqrt(np.diag(self._xtx) / self.moment_count)
+        # Outputy są całkowite - różnica predykcji rzędu 0.01 nie zmienia zaokrąglenia
+        if float(np.abs(self.coeffs_ - rounded) @ rms_powers) >= 1e-2:
+            return None
+        
+        return tuple(int(c) for c in rounded)
+    
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Zwraca stan modelu jako słownik tablic NumPy (do zapisu w formacie .npz).
+        
+        Zapisywane są tylko liczby: parametry epsilon, liczniki, współczynniki wielomianu
+        i równania normalne.
+        """
+        return {
+            'epsilon': np.array([self.epsilon, self.epsilon_min, self.epsilon_decay]),
+            'output_range': np.array(self.output_range, dtype=np.int64),
+            'counts': np.array([self.interaction_count, self.positive_feedback_count,
+                                self.moment_count, int(self.is_fitted)], dtype=np.int64),
+            'coefficients': self.coeffs_,
+            'xtx': self._xtx,
+            'xty': self._xty,
+            # -1 = nieznana wersja danych (None)
+            'data_version': np.array([-1 if self.data_version is None else self.data_version], dtype=np.int64),
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> 'MLModel':
+        """
+        Odtwarza model ze stanu zwróconego przez get_state().
+        
+        Args:
+            state: Słownik tablic (np. wczytany z pliku .npz)
+            
+        Returns:
+            Gotowy do użycia model
+        """
+        epsilon, epsilon_min, epsilon_decay = state['epsilon'].tolist()
+        model = cls(epsilon_start=epsilon, epsilon_min=epsilon_min, epsilon_decay=epsilon_decay,
+                    output_range=tuple(state['output_range'].tolist()))
+        
+        interaction_count, positive_count, moment_count, is_fitted = state['counts'].tolist()
+        model.interaction_count = interaction_count
+        model.positive_feedback_count = positive_count
+        model.moment_count = moment_count
+        model._xtx = np.array(state['xtx'], dtype=np.float64)
+        model._xty = np.array(state['xty'], dtype=np.float64)
+        
+        model._set_coefficients(state['coefficients'])
+        model.is_fitted = bool(is_fitted)
+        
+        # Pliki sprzed zapisywania wersji danych nie mają tego klucza
+        if 'data_version' in state:
+            data_version = int(state['data_version'][0])
+            model.data_version = None if data_version < 0 else data_version
+        
+        return model
     
     def get_explanation(self) -> str:
         """Zwraca wyjaśnienie ostatniej predykcji."""
@@ -252,24 +609,9 @@ class MLModel:
         if not self.is_fitted:
             return "Model nie jest jeszcze wytrenowany. Użyj 'train', 'auto_train' albo 'retrain'."
 
-        try:
-            linear = self.model.named_steps['linear']
-            coefs = getattr(linear, 'coef_', None)
-            intercept = getattr(linear, 'intercept_', None)
-        except Exception:
-            return "Nie można pobrać współczynników modelu."
-
-        if coefs is None or intercept is None:
-            return "Brak współczynników - model nie został dopasowany."
-
-        # Uwzględnij cechę bias (coef_[0]) razem z interceptem jako stałą.
-        c0 = float(coefs[0]) if len(coefs) > 0 else 0.0
-        c1 = float(coefs[1]) if len(coefs) > 1 else 0.0
-        c2 = float(coefs[2]) if len(coefs) > 2 else 0.0
-        c3 = float(coefs[3]) if len(coefs) > 3 else 0.0
-        a0 = float(intercept) + c0
+        a0, c1, c2, c3 = self.coeffs_.tolist()
 
         formula = f"y = {a0:.6f} + {c1:.6f}*x + {c2:.6f}*x^2 + {c3:.6f}*x^3"
-        raw_coef = ", ".join(f"{float(v):.6f}" for v in coefs)
-        details = f"intercept = {float(intercept):.6f}\ncoef = [{raw_coef}]"
+        raw_coef = ", ".join(f"{v:.6f}" for v in (c1, c2, c3))
+        details = f"intercept = {a0:.6f}\ncoef = [{raw_coef}]"
         return f"{formula}\n{details}"
@@ -3,8 +3,13 @@ Moduł statystyk i analityki - monitoring postępów uczenia.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 import math
+import time
+
+import numpy as np
+
+from interaction_buffer import InteractionBuffer
 
 
 class Statistics:
@@ -13,8 +18,13 @@ class Statistics:
     def __init__(self):
         """Inicjalizacja trackera statystyk."""
         self.session_start = datetime.now()
+        # Czas trwania liczony z zegara monotonicznego (tańszy i odporny na zmianę czasu systemowego)
+        self._session_start_monotonic = time.monotonic()
         self.session_interactions = 0
         self.session_positives = 0
+        
+        # Skuteczność sesji liczona tylko po zmianie liczników (None = do przeliczenia)
+        self._positive_rate: Optional[float] = None
     
     def update_session(self, feedback_value: float) -> None:
         """
@@ -26,48 +36,66 @@ class Statistics:
         self.session_interactions += 1
         if feedback_value > 0:
             self.session_positives += 1
+        self._positive_rate = None
+    
+    def update_session_bulk(self, feedback_values) -> None:
+        """
+        Aktualizuje statystyki sesji dla całej paczki feedbacków naraz.
+        
+        Args:
+            feedback_values: Tablica NumPy z wartościami feedbacku
+        """
+        self.session_interactions += len(feedback_values)
+        self.session_positives += int((feedback_values > 0).sum())
+        self._positive_rate = None
     
     def get_session_stats(self) -> Dict:
         """Zwraca statystyki bieżącej sesji."""
-        duration = datetime.now() - self.session_start
+        duration = timedelta(seconds=time.monotonic() - self._session_start_monotonic)
+        
+        if self._positive_rate is None:
+            self._positive_rate = self.session_positives / max(1, self.session_interactions)
         
         return {
             'duration': duration,
             'interactions': self.session_interactions,
-            'positive_rate': self.session_positives / max(1, self.session_interactions)
+            'positive_rate': self._positive_rate
         }
     
-    def calculate_learning_curve(self, interactions: List[Dict], window_size: int = 10) -> List[float]:
+    def _positive_flags(self, interactions: Union[List[Dict], InteractionBuffer]) -> np.ndarray:
+        """Maska pozytywnego feedbacku (bool) dla listy słowników albo InteractionBuffer."""
+        if isinstance(interactions, InteractionBuffer):
+            return interactions.feedback > 0
+        return np.fromiter((interaction['feedback_value'] > 0 for interaction in interactions),
+                           dtype=bool, count=len(interactions))
+    
+    def calculate_learning_curve(self, interactions: Union[List[Dict], InteractionBuffer],
+                                 window_size: int = 10) -> List[float]:
         """
         Oblicza krzywą uczenia (moving average pozytywnego feedbacku).
         
         Args:
-            interactions: Lista interakcji z bazy danych
+            interactions: Interakcje z bazy danych (od najnowszych) - lista albo InteractionBuffer
             window_size: Rozmiar okna dla średniej ruchomej
             
         Returns:
             Lista wartości accuracy w czasie
         """
-        if not interactions:
+        n = len(interactions)
+        if n == 0:
             return []
         
-        # Odwróć kolejność (od najstarszych)
-        interactions = list(reversed(interactions))
+        # Odwróć kolejność (od najstarszych) i zamień na tablicę 0/1 (pozytywny feedback)
+        positive = self._positive_flags(interactions)[::-1].astype(np.int64)
         
-        curve = []
-        for i in range(len(interactions)):
-            # Weź ostatnie window_size interakcji
-            start_idx = max(0, i - window_size + 1)
-            window = interactions[start_idx:i+1]
-            
-            # Policz pozytywne
-            positives = sum(1 for interaction in window 
-                          if interaction['feedback_value'] > 0)
-            
-            accuracy = positives / len(window)
-            curve.append(accuracy)
+        # Średnia ruchoma z sum prefiksowych: liczba pozytywnych w oknie [start, i]
+        # to cumsum[i+1] - cumsum[start] - O(N) zamiast O(N·window_size)
+        cumsum = np.concatenate(([0], np.cumsum(positive)))
+        end_idx = np.arange(1, n + 1)
+        start_idx = np.maximum(0, end_idx - window_size)
+        curve = (cumsum[end_idx] - cumsum[start_idx]) / (end_idx - start_idx)
         
-        return curve
+        return curve.tolist()
     
     def generate_progress_bar(self, value: float, width: int = 20) -> str:
         """
@@ -106,23 +134,16 @@ class Statistics:
         else:
             sampled = values
         
-        # Normalizuj do wysokości
-        chart_lines = []
-        for row in range(height, 0, -1):
-            line = ""
-            threshold = row / height
-            
-            for val in sampled:
-                if val >= threshold:
-                    line += "▓"
-                elif val >= threshold - 0.2:
-                    line += "░"
-                else:
-                    line += " "
-            
-            # Dodaj oś Y
-            y_label = f"{threshold:.1f}"
-            chart_lines.append(f"{y_label:>4} │{line}")
+        # Cała siatka naraz: wiersz r ma próg (height - r) / height, kolumna to wartość
+        vals = np.asarray(sampled, dtype=np.float64)
+        thresholds = np.arange(height, 0, -1) / height
+        above = vals[None, :] >= thresholds[:, None]
+        near = vals[None, :] >= thresholds[:, None] - 0.2
+        grid = np.where(above, "▓", np.where(near, "░", " "))
+        
+        # Dodaj oś Y
+        chart_lines = [f"{threshold:>4.1f} │" + "".join(cells)
+                       for threshold, cells in zip(thresholds.tolist(), grid.tolist())]
         
         # Dodaj oś X
         chart_lines.append("     └" + "─" * len(sampled))
@@ -131,18 +152,14 @@ class Statistics:
     
     def format_duration(self, duration: timedelta) -> str:
         """Formatuje czas trwania czytelnie."""
-        total_seconds = int(duration.total_seconds())
+        hours, rest = divmod(int(duration.total_seconds()), 3600)
+        minutes, seconds = divmod(rest, 60)
         
-        if total_seconds < 60:
-            return f"{total_seconds}s"
-        elif total_seconds < 3600:
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
-            return f"{minutes}m {seconds}s"
-        else:
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
+        if hours:
             return f"{hours}h {minutes}m"
+        if minutes:
+            return f"{minutes}m {seconds}s"
+        return f"{seconds}s"
     
     def get_feedback_distribution(self, stats: Dict) -> str:
         """
@@ -174,37 +191,33 @@ class Statistics:
         like_bar = '👍' * int(like_pct * bar_width)
         dislike_bar = '👎' * int(dislike_pct * bar_width)
         
-        result = f"Love:    {love_bar} {love_pct:.1%} ({loves})\n"
-        result += f"Like:    {like_bar} {like_pct:.1%} ({likes})\n"
-        result += f"Dislike: {dislike_bar} {dislike_pct:.1%} ({dislikes})"
-        
-        return result
+        return "\n".join([
+            f"Love:    {love_bar} {love_pct:.1%} ({loves})",
+            f"Like:    {like_bar} {like_pct:.1%} ({likes})",
+            f"Dislike: {dislike_bar} {dislike_pct:.1%} ({dislikes})",
+        ])
     
-    def calculate_trend(self, interactions: List[Dict], recent_n: int = 20) -> str:
+    def calculate_trend(self, interactions: Union[List[Dict], InteractionBuffer], recent_n: int = 20) -> str:
         """
         Oblicza trend (improvement/decline) w ostatnich N interakcjach.
         
         Args:
-            interactions: Lista interakcji
+            interactions: Lista interakcji albo InteractionBuffer
             recent_n: Liczba ostatnich interakcji do analizy
             
         Returns:
             String opisujący trend
         """
-        if len(interactions) < recent_n:
+        # Przy recent_n < 2 jedna z połówek byłaby pusta
+        if len(interactions) < recent_n or recent_n < 2:
             return "Za mało danych"
         
-        # Podziel na dwie połowy
+        # Jedna maska pozytywnego feedbacku, podzielona na dwie połowy
         mid = recent_n // 2
-        first_half = interactions[:mid]
-        second_half = interactions[mid:recent_n]
-        
-        # Policz pozytywne w każdej połowie
-        first_positive = sum(1 for i in first_half if i['feedback_value'] > 0)
-        second_positive = sum(1 for i in second_half if i['feedback_value'] > 0)
+        positive = self._positive_flags(interactions[:recent_n])
         
-        first_rate = first_positive / len(first_half)
-        second_rate = second_positive / len(second_half)
+        first_rate = float(positive[:mid].mean())
+        second_rate = float(positive[mid:].mean())
         
         diff = second_rate - first_rate
         
@@ -1,41 +1,243 @@
 """
-Moduł zarządzania danymi - SQLite dla interakcji oraz pickle dla modelu ML.
+Moduł zarządzania danymi - SQLite dla interakcji oraz pliki .npz dla modelu ML.
 Obsługuje persistence między sesjami i możliwość resetu.
+Starsze modele zapisane jako pickle (.pkl) nadal są wczytywane.
 """
 
+import atexit
+import secrets
 import sqlite3
+import threading
+import time
 import pickle
 import os
+import numpy as np
 from datetime import datetime
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
+
+from interaction_buffer import InteractionBuffer
+from ml_model import MLModel
+
+
+# Układ tablicy z danymi treningowymi zwracanej przez get_all_interactions_arrays
+TRAINING_DTYPE = np.dtype([('x', np.int64), ('y', np.int64), ('fv', np.float64)])
+
+# Stałe teksty zapytań - ten sam string za każdym razem trafia w cache przygotowanych
+# instrukcji połączenia, więc SQLite nie parsuje go od nowa
+INSERT_INTERACTION_SQL = """
+    INSERT INTO interactions 
+    (timestamp, user_input, model_output, expected_output, feedback, feedback_value, exploration)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+SELECT_RECENT_SQL = """
+    SELECT * FROM interactions 
+    ORDER BY id DESC 
+    LIMIT ?
+"""
+
+SELECT_TRAINING_SQL = """
+    SELECT user_input, 
+           COALESCE(expected_output, model_output) as output,
+           feedback_value 
+    FROM interactions 
+    ORDER BY id ASC
+"""
+
+SELECT_RECENT_TRAINING_SQL = """
+    SELECT user_input, 
+           COALESCE(expected_output, model_output) as output,
+           feedback_value 
+    FROM interactions 
+    ORDER BY id DESC 
+    LIMIT ?
+"""
+
+# Eksport całej historii (od najnowszych) - kursor jest czytany strumieniowo, więc bez limitu
+EXPORT_SQL = """
+    SELECT * FROM interactions 
+    ORDER BY id DESC
+"""
+
+# Wszystkie liczniki statystyk w jednym skanie tabeli
+COUNT_STATISTICS_SQL = """
+    SELECT COUNT(*),
+           COALESCE(SUM(feedback = 'like'), 0),
+           COALESCE(SUM(feedback = 'love'), 0),
+           COALESCE(SUM(feedback = 'dislike'), 0),
+           COALESCE(SUM(exploration = 1), 0)
+    FROM interactions
+"""
+
+# Wersja schematu bazy zapisywana w PRAGMA user_version (patrz _initialize_database)
+SCHEMA_VERSION = 3
+
+# Wersja danych (patrz DataStorage.data_version) trzymana w tabeli meta
+SELECT_DATA_VERSION_SQL = "SELECT value FROM meta WHERE key = 'data_version'"
+SET_DATA_VERSION_SQL = "INSERT OR REPLACE INTO meta (key, value) VALUES ('data_version', ?)"
+
+# Rozmiar cache przygotowanych instrukcji na połączenie (domyślnie 128)
+CACHED_STATEMENTS = 256
+
+# Co ile sekund odświeżać statystyki planera zapytań (PRAGMA optimize)
+OPTIMIZE_INTERVAL = 900
+
+# Co ile sekund wątek w tle przenosi WAL do bazy (PRAGMA wal_checkpoint)
+CHECKPOINT_INTERVAL = 60
+
+# Rozszerzenie plików modelu (numpy .npz) i starszego formatu (pickle)
+MODEL_EXT = ".npz"
+LEGACY_MODEL_EXT = ".pkl"
 
 
 class DataStorage:
     """Zarządzanie bazą danych SQLite i persistencją modelu."""
     
-    def __init__(self, db_path: str = "data/interactions.db", model_path: str = "models/ml_model.pkl"):
+    def __init__(self, db_path: str = "data/interactions.db", model_path: str = "models/ml_model.npz"):
         """
         Inicjalizacja storage.
         
         Args:
             db_path: Ścieżka do bazy danych SQLite
-            model_path: Ścieżka do zapisanego modelu pickle
+            model_path: Ścieżka do zapisanego modelu (.npz; obok szukany jest też stary .pkl)
         """
         self.db_path = db_path
-        self.model_path = model_path
+        model_base = os.path.splitext(model_path)[0]
+        self.model_path = model_base + MODEL_EXT
+        self.legacy_model_path = model_base + LEGACY_MODEL_EXT
         self.models_dir = "models"
         
+        # Liczniki statystyk trzymane w pamięci (None = trzeba przeliczyć z bazy)
+        self._stats_counts: Optional[Dict[str, int]] = None
+        # Ostatni wynik get_statistics - ważny do następnej zmiany danych
+        self._stats_cache: Optional[Dict] = None
+        # Znacznik wersji danych (patrz data_version) - ustawiany w _initialize_database
+        self._data_version = 0
+        
         # Upewnij się, że katalogi istnieją
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         Path(model_path).parent.mkdir(parents=True, exist_ok=True)
         Path(self.models_dir).mkdir(parents=True, exist_ok=True)
         
+        # Jedno trwałe połączenie zamiast otwierania bazy przy każdym wywołaniu
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     cached_statements=CACHED_STATEMENTS)
+        # Połączenie jest współdzielone między wątkami - jeden zamek na wszystkie operacje
+        self._lock = threading.RLock()
+        
+        # Interakcje zapisane w transaction() czekają tu na wspólny zapis na końcu bloku
+        self._pending: List[tuple] = []
+        # Głębokość zagnieżdżenia transaction() - w transakcji bufor nie jest opróżniany automatycznie
+        self._transaction_depth = 0
+        self._last_optimize = time.monotonic()
+        # Timer musi istnieć przed atexit - close() może ruszyć, zanim go zaplanujemy
+        self._checkpoint_timer: Optional[threading.Timer] = None
+        atexit.register(self.close)
+        
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-8000")  # ~8 MB cache stron
+        self._conn.execute("PRAGMA mmap_size=268435456")  # odczyty przez mmap (do 256 MB) zamiast read()
+        # Rzadszy automatyczny checkpoint przy zapisie - WAL opróżnia głównie wątek w tle
+        self._conn.execute("PRAGMA wal_autocheckpoint=10000")
+        
         self._initialize_database()
+        
+        self._schedule_checkpoint()
+    
+    def close(self) -> None:
+        """Zapisuje oczekujące interakcje i zamyka połączenie z bazą danych."""
+        with self._lock:
+            if self._conn is not None:
+                if self._checkpoint_timer is not None:
+                    self._checkpoint_timer.cancel()
+                self._flush_pending()
+                self._conn.execute("PRAGMA optimize")
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+                self._conn = None
+    
+    def _schedule_checkpoint(self) -> None:
+        """Planuje kolejny checkpoint WAL w wątku w tle (daemon - nie blokuje wyjścia)."""
+        self._checkpoint_timer = threading.Timer(CHECKPOINT_INTERVAL, self._checkpoint)
+        self._checkpoint_timer.daemon = True
+        self._checkpoint_timer.start()
+    
+    def _checkpoint(self) -> None:
+        """Przenosi WAL do pliku bazy bez czekania na czytelników i planuje następny checkpoint."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            self._schedule_checkpoint()
+    
+    def flush(self) -> None:
+        """Zapisuje do bazy interakcje czekające w buforze."""
+        with self._lock:
+            self._flush_pending()
+    
+    def _flush_pending(self) -> None:
+        """Zapisuje bufor jedną transakcją (wywoływane z trzymanym zamkiem)."""
+        if self._pending:
+            rows, self._pending = self._pending, []
+            with self._conn as conn:
+                conn.executemany(INSERT_INTERACTION_SQL, rows)
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Daje dostęp do połączenia w transakcji, pod zamkiem.
+        
+        Najpierw zapisuje bufor interakcji, żeby każde zapytanie widziało wszystkie dane.
+        """
+        with self._lock:
+            self._flush_pending()
+            self._optimize_if_due()
+            with self._conn as conn:
+                yield conn
+    
+    def _optimize_if_due(self) -> None:
+        """Co OPTIMIZE_INTERVAL sekund uruchamia PRAGMA optimize (wywoływane z trzymanym zamkiem)."""
+        now = time.monotonic()
+        if now - self._last_optimize > OPTIMIZE_INTERVAL:
+            self._conn.execute("PRAGMA optimize")
+            self._last_optimize = now
+    
+    @contextmanager
+    def transaction(self) -> Iterator['DataStorage']:
+        """
+        Grupuje wiele save_interaction w jeden commit.
+        
+        Interakcje zapisane w bloku czekają w buforze i trafiają do bazy jednym
+        executemany na jego końcu. Przy wyjątku są odrzucane (rollback). Odczyty
+        wewnątrz bloku zapisują bufor wcześniej - tych wierszy nie da się już wycofać.
+        
+        Przykład:
+            with storage.transaction():
+                storage.save_interaction(...)
+                storage.save_interaction(...)
+        """
+        with self._lock:
+            start = len(self._pending)
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                del self._pending[start:]
+                self._invalidate_statistics()
+                raise
+            finally:
+                self._transaction_depth -= 1
+            
+            if not self._transaction_depth:
+                self._flush_pending()
     
     def _initialize_database(self) -> None:
         """Tworzy tabelę interakcji jeśli nie istnieje."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS interactions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,22 +251,67 @@ class DataStorage:
                 )
             """)
             
-            # Dodaj kolumnę expected_output do istniejących tabel (jeśli nie ma)
-            try:
-                conn.execute("ALTER TABLE interactions ADD COLUMN expected_output INTEGER")
-                conn.commit()
-            except sqlite3.OperationalError:
-                # Kolumna już istnieje
-                pass
+            # Migracje schematu numerowane w PRAGMA user_version - przy aktualnej bazie
+            # start kosztuje jeden odczyt pragmy zamiast próby ALTER TABLE i wyjątku
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
             
-            # Indeks dla szybszych zapytań
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp 
-                ON interactions(timestamp DESC)
-            """)
+            if version < 1:
+                # Dodaj kolumnę expected_output do istniejących tabel (jeśli nie ma)
+                try:
+                    conn.execute("ALTER TABLE interactions ADD COLUMN expected_output INTEGER")
+                except sqlite3.OperationalError:
+                    # Kolumna już istnieje
+                    pass
+            
+            if version < 2:
+                # Kolejność interakcji wyznacza id (AUTOINCREMENT) - zapytania idą po kluczu
+                # głównym bez sortowania, więc stary indeks po timestamp jest zbędny
+                conn.execute("DROP INDEX IF EXISTS idx_timestamp")
+                
+                # Indeks pokrywający dla statystyk - COUNT_STATISTICS_SQL czyta tylko liście
+                # indeksu (feedback, exploration) zamiast całych wierszy tabeli
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_feedback_expl 
+                    ON interactions(feedback, exploration)
+                """)
+            
+            if version < 3:
+                # Metadane bazy - m.in. wersja danych do sprawdzania zgodności modelu z bazą
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS meta (
+                        key TEXT PRIMARY KEY,
+                        value INTEGER NOT NULL
+                    )
+                """)
+            
+            if version < SCHEMA_VERSION:
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            
+            row = conn.execute(SELECT_DATA_VERSION_SQL).fetchone()
+            if row is None:
+                self._set_data_version(conn)
+            else:
+                self._data_version = row[0]
             
             conn.commit()
     
+    @property
+    def data_version(self) -> int:
+        """
+        Losowy znacznik aktualnego zestawu danych.
+        
+        Zmienia się przy każdej zmianie, która nie jest zwykłym dopisaniem wiersza
+        (reset_database, delete_last_interaction), oraz dla każdej nowej bazy. Model
+        zapamiętuje znacznik danych, z których zbudował równania normalne - przy tym
+        samym znaczniku i tej samej liczbie pozytywnych przykładów obejmuje dokładnie dane z bazy.
+        """
+        return self._data_version
+    
+    def _set_data_version(self, conn: sqlite3.Connection) -> None:
+        """Nadaje danym nowy losowy znacznik wersji (w transakcji wywołującego)."""
+        self._data_version = secrets.randbits(62)
+        conn.execute(SET_DATA_VERSION_SQL, (self._data_version,))
+    
     def save_interaction(self, user_input: int, model_output: int, 
                         expected_output: Optional[int],
                         feedback: str, feedback_value: float, 
@@ -72,6 +319,10 @@ class DataStorage:
         """
         Zapisuje pojedynczą interakcję do bazy danych.
         
+        Poza transaction() wiersz jest zapisywany od razu - odpowiedzi wpisane ręcznie
+        nie mogą zginąć przy zabiciu procesu czy zamknięciu terminala (atexit wtedy nie
+        działa). W transaction() wiersz czeka w buforze i trafia do bazy na końcu bloku.
+        
         Args:
             user_input: Liczba podana przez użytkownika
             model_output: Liczba zwrócona przez model
@@ -82,13 +333,39 @@ class DataStorage:
         """
         timestamp = datetime.now().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO interactions 
-                (timestamp, user_input, model_output, expected_output, feedback, feedback_value, exploration)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (timestamp, user_input, model_output, expected_output, feedback, feedback_value, exploration))
+        with self._lock:
+            self._pending.append((timestamp, user_input, model_output, expected_output,
+                                  feedback, feedback_value, exploration))
+            if not self._transaction_depth:
+                self._flush_pending()
+            
+            # Aktualizuj liczniki statystyk inkrementalnie zamiast przeliczać całą tabelę
+            self._stats_cache = None
+            if self._stats_counts is not None:
+                self._stats_counts['total'] += 1
+                if feedback in self._stats_counts:
+                    self._stats_counts[feedback] += 1
+                if exploration:
+                    self._stats_counts['exploration'] += 1
+    
+    def save_interactions_bulk(self, rows: List[Tuple[int, int, Optional[int], str, float, bool]]) -> None:
+        """
+        Zapisuje wiele interakcji w jednej transakcji (jeden commit zamiast N).
+        
+        Args:
+            rows: Lista tupli (user_input, model_output, expected_output,
+                  feedback, feedback_value, exploration)
+        """
+        if not rows:
+            return
+        
+        with self._connection() as conn:
+            # Jeden znacznik czasu dla całej paczki (kolejność wierszy i tak wyznacza id)
+            timestamp = datetime.now().isoformat()
+            conn.executemany(INSERT_INTERACTION_SQL, [(timestamp, *row) for row in rows])
             conn.commit()
+        
+        self._invalidate_statistics()
     
     def get_recent_interactions(self, limit: int = 10) -> List[Dict]:
         """
@@ -100,84 +377,127 @@ class DataStorage:
         Returns:
             Lista słowników z danymi interakcji
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM interactions 
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            """, (limit,))
-            
-            return [dict(row) for row in cursor.fetchall()]
+        with self._connection() as conn:
+            return self._fetch_dicts(conn.execute(SELECT_RECENT_SQL, (limit,)))
+    
+    def _fetch_dicts(self, cursor: sqlite3.Cursor) -> List[Dict]:
+        """
+        Zamienia wiersze kursora na słowniki.
+        
+        Nazwy kolumn są brane raz z cursor.description (kolejność kolumn zależy od
+        historii migracji bazy), a każdy wiersz to jeden dict(zip(...)) - bez
+        pośredniego sqlite3.Row i bez listy z fetchall().
+        """
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
     
     def get_all_interactions(self) -> List[Tuple[int, int, float]]:
         """
         Pobiera wszystkie interakcje dla treningu modelu.
         
+        Trening w aplikacji korzysta z get_all_interactions_arrays - ta wersja
+        zostaje dla kodu, który potrzebuje zwykłej listy tupli.
+        
         Returns:
             Lista tupli (user_input, expected_output, feedback_value)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT user_input, 
-                       COALESCE(expected_output, model_output) as output,
-                       feedback_value 
-                FROM interactions 
-                ORDER BY timestamp ASC
-            """)
+        return self.get_all_interactions_arrays().tolist()
+    
+    def get_all_interactions_arrays(self) -> np.ndarray:
+        """
+        Pobiera wszystkie interakcje dla treningu jako tablicę strukturalną NumPy.
+        
+        Wiersze trafiają z kursora prosto do tablicy (np.fromiter), bez listy tupli po drodze.
+        
+        Returns:
+            Tablica z polami 'x' (user_input), 'y' (expected_output) i 'fv' (feedback_value)
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(SELECT_TRAINING_SQL)
+            
+            return np.fromiter(cursor, dtype=TRAINING_DTYPE)
+    
+    def get_recent_interactions_buffer(self, limit: int = 1000) -> InteractionBuffer:
+        """
+        Pobiera ostatnie N interakcji jako InteractionBuffer (od najnowszych, jak get_recent_interactions).
+        
+        Args:
+            limit: Maksymalna liczba wyników
+            
+        Returns:
+            Bufor z kolumnami inputs, outputs (oczekiwane) i feedback
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(SELECT_RECENT_TRAINING_SQL, (limit,))
             
-            return cursor.fetchall()
+            data = np.fromiter(cursor, dtype=TRAINING_DTYPE)
+        
+        return InteractionBuffer.from_arrays(data['x'], data['y'], data['fv'])
     
     def get_statistics(self) -> Dict:
         """
         Oblicza podstawowe statystyki z bazy danych.
         
+        Liczniki są cache'owane w pamięci i aktualizowane przy save_interaction,
+        więc baza jest odpytywana tylko po zmianach, których nie da się policzyć inkrementalnie.
+        Gotowy słownik jest zapamiętywany do następnej zmiany danych.
+        
         Returns:
             Słownik ze statystykami
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Całkowita liczba interakcji
-            total = conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
-            
-            if total == 0:
-                return {
-                    'total_interactions': 0,
-                    'likes': 0,
-                    'dislikes': 0,
-                    'loves': 0,
-                    'positive_rate': 0.0,
-                    'exploration_rate': 0.0
-                }
-            
-            # Rozkład feedbacku
-            feedback_counts = conn.execute("""
-                SELECT feedback, COUNT(*) as count 
-                FROM interactions 
-                GROUP BY feedback
-            """).fetchall()
-            
-            feedback_dict = {row[0]: row[1] for row in feedback_counts}
-            
-            # Procent eksploracji
-            exploration_count = conn.execute("""
-                SELECT COUNT(*) FROM interactions WHERE exploration = 1
-            """).fetchone()[0]
-            
-            likes = feedback_dict.get('like', 0)
-            loves = feedback_dict.get('love', 0)
-            dislikes = feedback_dict.get('dislike', 0)
-            
-            positive_rate = (likes + loves) / total if total > 0 else 0.0
-            exploration_rate = exploration_count / total if total > 0 else 0.0
-            
+        with self._lock:
+            if self._stats_cache is None:
+                self._stats_cache = self._compute_statistics()
+            return self._stats_cache
+    
+    def _compute_statistics(self) -> Dict:
+        """Buduje słownik statystyk z liczników (liczonych z bazy tylko gdy ich brak)."""
+        if self._stats_counts is None:
+            self._stats_counts = self._count_statistics()
+        
+        counts = self._stats_counts
+        total = counts['total']
+        
+        if total == 0:
             return {
-                'total_interactions': total,
-                'likes': likes,
-                'dislikes': dislikes,
-                'loves': loves,
-                'positive_rate': positive_rate,
-                'exploration_rate': exploration_rate
+                'total_interactions': 0,
+                'likes': 0,
+                'dislikes': 0,
+                'loves': 0,
+                'positive_rate': 0.0,
+                'exploration_rate': 0.0
             }
+        
+        likes = counts['like']
+        loves = counts['love']
+        dislikes = counts['dislike']
+        
+        return {
+            'total_interactions': total,
+            'likes': likes,
+            'dislikes': dislikes,
+            'loves': loves,
+            'positive_rate': (likes + loves) / total,
+            'exploration_rate': counts['exploration'] / total
+        }
+    
+    def _invalidate_statistics(self) -> None:
+        """Unieważnia liczniki i zapamiętany wynik statystyk (po zmianach nieliczonych inkrementalnie)."""
+        self._stats_counts = None
+        self._stats_cache = None
+    
+    def _count_statistics(self) -> Dict[str, int]:
+        """Liczy surowe liczniki statystyk bezpośrednio z bazy danych (jedno przejście po tabeli)."""
+        with self._connection() as conn:
+            total, likes, loves, dislikes, exploration = conn.execute(COUNT_STATISTICS_SQL).fetchone()
+        
+        return {
+            'total': total,
+            'like': likes,
+            'love': loves,
+            'dislike': dislikes,
+            'exploration': exploration
+        }
     
     def delete_last_interaction(self) -> Optional[Dict]:
         """
@@ -186,87 +506,156 @@ class DataStorage:
         Returns:
             Słownik z danymi usuniętej interakcji lub None jeśli baza pusta
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        with self._connection() as conn:
             # Pobierz ostatnią interakcję
-            cursor = conn.execute("""
-                SELECT * FROM interactions 
-                ORDER BY id DESC 
-                LIMIT 1
-            """)
-            last_interaction = cursor.fetchone()
+            rows = self._fetch_dicts(conn.execute(SELECT_RECENT_SQL, (1,)))
             
-            if not last_interaction:
+            if not rows:
                 return None
+            last_interaction = rows[0]
             
             # Usuń ostatnią interakcję
             conn.execute("""
                 DELETE FROM interactions 
                 WHERE id = ?
             """, (last_interaction['id'],))
+            self._set_data_version(conn)
             conn.commit()
             
-            return dict(last_interaction)
+            self._invalidate_statistics()
+            return last_interaction
     
     def reset_database(self) -> None:
         """Usuwa wszystkie dane z bazy (hard reset)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("DELETE FROM interactions")
+            self._set_data_version(conn)
             conn.commit()
+        
+        self._invalidate_statistics()
+    
+    def _write_model(self, model: MLModel, path: str) -> None:
+        """
+        Zapisuje stan modelu do pliku .npz atomowo (plik tymczasowy + os.replace).
+        
+        Plik tymczasowy jest synchronizowany na dysk przed podmianą, więc po awarii
+        pod ścieżką modelu leży albo stara, albo nowa kompletna wersja.
+        
+        Args:
+            model: Model do zapisania
+            path: Docelowa ścieżka pliku
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **model.get_state())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    def _read_model(self, path: str) -> MLModel:
+        """
+        Wczytuje model z pliku .npz albo ze starszego pliku pickle.
+        
+        Args:
+            path: Ścieżka do pliku modelu
+        """
+        if path.endswith(LEGACY_MODEL_EXT):
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        
+        with np.load(path) as data:
+            return MLModel.from_state(dict(data))
+    
+    def _existing_model_path(self, path: str, legacy_path: str) -> Optional[str]:
+        """Zwraca ścieżkę istniejącego pliku modelu (preferując .npz) lub None."""
+        for candidate in (path, legacy_path):
+            if os.path.exists(candidate):
+                return candidate
+        return None
+    
+    def _read_existing_model(self, path: str, legacy_path: str) -> Optional[MLModel]:
+        """
+        Wczytuje pierwszy istniejący plik modelu (preferując .npz).
+        
+        Plik jest od razu otwierany (EAFP) - brak pliku to FileNotFoundError,
+        bez osobnego sprawdzania os.path.exists przed odczytem.
+        
+        Returns:
+            Wczytany model lub None jeśli żaden plik nie istnieje
+        """
+        for candidate in (path, legacy_path):
+            try:
+                return self._read_model(candidate)
+            except FileNotFoundError:
+                continue
+        return None
+    
+    def _named_model_paths(self, model_name: str) -> Tuple[str, str]:
+        """Zwraca ścieżki (.npz, .pkl) dla modelu o podanej nazwie."""
+        # Usuń rozszerzenie jeśli użytkownik je podał
+        base = os.path.splitext(model_name)[0] if model_name.endswith((MODEL_EXT, LEGACY_MODEL_EXT)) else model_name
+        base = os.path.join(self.models_dir, base)
+        return base + MODEL_EXT, base + LEGACY_MODEL_EXT
     
-    def save_model(self, model) -> None:
+    def save_model(self, model: MLModel) -> None:
         """
-        Zapisuje model ML do pliku pickle.
+        Zapisuje model ML do pliku .npz.
         
         Args:
             model: Obiekt modelu do zapisania
         """
-        with open(self.model_path, 'wb') as f:
-            pickle.dump(model, f)
+        self._write_model(model, self.model_path)
     
-    def load_model(self) -> Optional[object]:
+    def load_model(self) -> Optional[MLModel]:
         """
-        Wczytuje model ML z pliku pickle.
+        Wczytuje model ML z pliku .npz (lub starszego pliku pickle).
         
         Returns:
             Wczytany model lub None jeśli plik nie istnieje
         """
-        if not os.path.exists(self.model_path):
-            return None
-        
         try:
-            with open(self.model_path, 'rb') as f:
-                return pickle.load(f)
+            return self._read_existing_model(self.model_path, self.legacy_model_path)
         except Exception as e:
             print(f"Błąd wczytywania modelu: {e}")
             return None
     
     def model_exists(self) -> bool:
         """Sprawdza czy zapisany model istnieje."""
-        return os.path.exists(self.model_path)
+        return self._existing_model_path(self.model_path, self.legacy_model_path) is not None
     
     def delete_model(self) -> None:
         """Usuwa zapisany model."""
-        if os.path.exists(self.model_path):
-            os.remove(self.model_path)
+        for path in (self.model_path, self.legacy_model_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
     
     def get_file_sizes(self) -> Dict[str, int]:
         """Zwraca rozmiary plików w bajtach."""
+        self.flush()
+        
         sizes = {
             'model_bytes': 0,
             'database_bytes': 0
         }
         
-        if os.path.exists(self.model_path):
-            sizes['model_bytes'] = os.path.getsize(self.model_path)
+        # Jeden os.stat na plik - brak pliku to po prostu rozmiar 0
+        for path in (self.model_path, self.legacy_model_path):
+            try:
+                sizes['model_bytes'] = os.stat(path).st_size
+                break
+            except FileNotFoundError:
+                continue
         
-        if os.path.exists(self.db_path):
-            sizes['database_bytes'] = os.path.getsize(self.db_path)
+        try:
+            sizes['database_bytes'] = os.stat(self.db_path).st_size
+        except FileNotFoundError:
+            pass
         
         return sizes
     
-    def save_model_as(self, model, model_name: str) -> str:
+    def save_model_as(self, model: MLModel, model_name: str) -> str:
         """
         Zapisuje model pod określoną nazwą.
         
@@ -277,18 +666,11 @@ class DataStorage:
         Returns:
             Pełna ścieżka do zapisanego pliku
         """
-        # Usuń rozszerzenie jeśli użytkownik je podał
-        if model_name.endswith('.pkl'):
-            model_name = model_name[:-4]
-        
-        model_path = os.path.join(self.models_dir, f"{model_name}.pkl")
-        
-        with open(model_path, 'wb') as f:
-            pickle.dump(model, f)
-        
+        model_path, _ = self._named_model_paths(model_name)
+        self._write_model(model, model_path)
         return model_path
     
-    def load_model_by_name(self, model_name: str) -> Optional[object]:
+    def load_model_by_name(self, model_name: str) -> Optional[MLModel]:
         """
         Wczytuje model po nazwie.
         
@@ -298,18 +680,8 @@ class DataStorage:
         Returns:
             Wczytany model lub None jeśli nie istnieje
         """
-        # Usuń rozszerzenie jeśli użytkownik je podał
-        if model_name.endswith('.pkl'):
-            model_name = model_name[:-4]
-        
-        model_path = os.path.join(self.models_dir, f"{model_name}.pkl")
-        
-        if not os.path.exists(model_path):
-            return None
-        
         try:
-            with open(model_path, 'rb') as f:
-                return pickle.load(f)
+            return self._read_existing_model(*self._named_model_paths(model_name))
         except Exception as e:
             print(f"Błąd wczytywania modelu '{model_name}': {e}")
             return None
@@ -321,33 +693,39 @@ class DataStorage:
         Returns:
             Lista słowników z informacjami o modelach
         """
-        models = []
-        
-        if not os.path.exists(self.models_dir):
-            return models
+        models = {}
         
-        for filename in os.listdir(self.models_dir):
-            if filename.endswith('.pkl'):
-                model_path = os.path.join(self.models_dir, filename)
-                model_name = filename[:-4]  # Usuń .pkl
+        # scandir zwraca wpisy razem z danymi katalogu - bez osobnego os.path.join/os.stat na plik
+        try:
+            entries = os.scandir(self.models_dir)
+        except FileNotFoundError:
+            return []
+        
+        with entries:
+            for entry in entries:
+                model_name, ext = os.path.splitext(entry.name)
+                if ext not in (MODEL_EXT, LEGACY_MODEL_EXT):
+                    continue
+                
+                # Jeśli model istnieje w obu formatach, pokaż wersję .npz (ta jest wczytywana)
+                if ext == LEGACY_MODEL_EXT and model_name in models:
+                    continue
                 
                 # Pobierz informacje o pliku
-                stat = os.stat(model_path)
+                stat = entry.stat()
                 size_kb = stat.st_size / 1024
                 modified = datetime.fromtimestamp(stat.st_mtime)
                 
-                models.append({
+                models[model_name] = {
                     'name': model_name,
-                    'filename': filename,
-                    'path': model_path,
+                    'filename': entry.name,
+                    'path': entry.path,
                     'size_kb': size_kb,
                     'modified': modified.strftime('%Y-%m-%d %H:%M:%S')
-                })
+                }
         
         # Sortuj po dacie modyfikacji (najnowsze pierwsze)
-        models.sort(key=lambda x: x['modified'], reverse=True)
-        
-        return models
+        return sorted(models.values(), key=lambda x: x['modified'], reverse=True)
     
     def delete_model_by_name(self, model_name: str) -> bool:
         """
@@ -359,17 +737,16 @@ class DataStorage:
         Returns:
             True jeśli usunięto, False jeśli nie istniał
         """
-        # Usuń rozszerzenie jeśli użytkownik je podał
-        if model_name.endswith('.pkl'):
-            model_name = model_name[:-4]
+        deleted = False
         
-        model_path = os.path.join(self.models_dir, f"{model_name}.pkl")
-        
-        if os.path.exists(model_path):
-            os.remove(model_path)
-            return True
+        for model_path in self._named_model_paths(model_name):
+            try:
+                os.remove(model_path)
+                deleted = True
+            except FileNotFoundError:
+                pass
         
-        return False
+        return deleted
     
     def export_to_csv(self, output_path: str = "data/export.csv") -> str:
         """
@@ -383,13 +760,15 @@ class DataStorage:
         """
         import csv
         
-        interactions = self.get_recent_interactions(limit=100000)  # wszystkie
-        
-        with open(output_path, 'w', newline='') as csvfile:
-            if interactions:
-                fieldnames = interactions[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(interactions)
+        # Wiersze idą prosto z kursora do pliku - bez budowania słownika dla każdej interakcji
+        with self._connection() as conn, open(output_path, 'w', newline='') as csvfile:
+            cursor = conn.execute(EXPORT_SQL)
+            
+            first_row = cursor.fetchone()
+            if first_row is not None:
+                writer = csv.writer(csvfile)
+                writer.writerow([column[0] for column in cursor.description])
+                writer.writerow(first_row)
+                writer.writerows(cursor)
         
         return output_path
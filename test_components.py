@@ -7,15 +7,16 @@ from storage import DataStorage
 from ml_model import MLModel
 
 # Test 1: Storage
-print("🧪 Test 1: Storage (SQLite + Pickle)")
+print("🧪 Test 1: Storage (SQLite + npz)")
 print("=" * 50)
 
-storage = DataStorage(db_path="data/test.db", model_path="models/test_model.pkl")
+storage = DataStorage(db_path="data/test.db", model_path="models/test_model.npz")
 
-# Zapisz przykładowe interakcje
-storage.save_interaction(10, 20, 'love', 2.0, False)
-storage.save_interaction(5, 10, 'like', 1.0, True)
-storage.save_interaction(7, 15, 'dislike', 0.0, False)
+# Zapisz przykładowe interakcje (jeden commit dla całej paczki)
+with storage.transaction():
+    storage.save_interaction(10, 20, 20, 'love', 2.0, False)
+    storage.save_interaction(5, 10, 10, 'like', 1.0, True)
+    storage.save_interaction(7, 15, None, 'dislike', 0.0, False)
 
 # Pobierz statystyki
 stats = storage.get_statistics()
@@ -65,12 +66,12 @@ print("=" * 50)
 
 # Zapisz model
 storage.save_model(model)
-print("Model zapisany do pickle...")
+print("Model zapisany do .npz...")
 
 # Wczytaj model
 loaded_model = storage.load_model()
 if loaded_model:
-    print("Model wczytany z pickle!")
+    print("Model wczytany z .npz!")
     
     # Testuj wczytany model
     test_prediction, _ = loaded_model.predict(10)
@@ -86,8 +87,9 @@ print("=" * 50)
 
 # Cleanup
 import os
+storage.close()
 if os.path.exists("data/test.db"):
     os.remove("data/test.db")
-if os.path.exists("models/test_model.pkl"):
-    os.remove("models/test_model.pkl")
+if os.path.exists("models/test_model.npz"):
+    os.remove("models/test_model.npz")
 print("\n🧹 Pliki testowe usunięte.")
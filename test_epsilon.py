@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Test epsilon decay - ile interakcji do eksploatacji."""
 
+import math
+
+import numpy as np
+
 from ml_model import MLModel
 
 m = MLModel()
@@ -10,45 +14,42 @@ print(f'Epsilon minimalne: {m.epsilon_min:.1%}')
 print(f'Epsilon decay: {m.epsilon_decay}')
 print()
 
+
+def interactions_until(threshold: float, inclusive: bool = False) -> int:
+    """
+    Liczba interakcji, po której epsilon spadnie poniżej progu (albo do progu, gdy inclusive).
+
+    Epsilon po n interakcjach to ε₀·decayⁿ, więc zamiast mnożyć w pętli wystarczy
+    rozwiązać ε₀·decayⁿ < próg względem n: n > log(próg/ε₀) / log(decay).
+    """
+    steps = math.log(threshold / m.epsilon) / math.log(m.epsilon_decay)
+    n = math.ceil(steps) if inclusive else math.floor(steps) + 1
+    return max(0, n)
+
+
 # Symulacja: ile interakcji do epsilon < 50%
-epsilon = m.epsilon
-interactions = 0
-while epsilon >= 0.5:
-    epsilon *= m.epsilon_decay
-    interactions += 1
+interactions = interactions_until(0.5)
 
 print(f'Po {interactions} interakcjach epsilon spadnie poniżej 50%')
 print(f'  → ~50% szans na eksplorację, 50% na model')
 print()
 
 # Ile do epsilon < 20%
-epsilon = m.epsilon
-interactions = 0
-while epsilon >= 0.2:
-    epsilon *= m.epsilon_decay
-    interactions += 1
+interactions = interactions_until(0.2)
 
 print(f'Po {interactions} interakcjach epsilon spadnie poniżej 20%')
 print(f'  → ~20% szans na eksplorację, 80% na model')
 print()
 
 # Ile do epsilon < 10%
-epsilon = m.epsilon
-interactions = 0
-while epsilon >= 0.1:
-    epsilon *= m.epsilon_decay
-    interactions += 1
+interactions = interactions_until(0.1)
 
 print(f'Po {interactions} interakcjach epsilon spadnie poniżej 10%')
 print(f'  → ~10% szans na eksplorację, 90% na model')
 print()
 
 # Ile do minimum
-epsilon = m.epsilon
-interactions = 0
-while epsilon > m.epsilon_min:
-    epsilon *= m.epsilon_decay
-    interactions += 1
+interactions = interactions_until(m.epsilon_min, inclusive=True)
 
 print(f'Po {interactions} interakcjach epsilon osiągnie minimum ({m.epsilon_min:.1%})')
 print(f'  → {m.epsilon_min:.1%} szans na eksplorację, {100-m.epsilon_min*100:.1f}% na model')
@@ -58,9 +59,8 @@ print()
 print('Szczegółowa tabela epsilon:')
 print('Interakcje | Epsilon | Szansa na model')
 print('-' * 40)
-epsilon = m.epsilon
-for i in [0, 1, 2, 3, 5, 10, 15, 20, 30, 40, 50]:
-    epsilon = m.epsilon * (m.epsilon_decay ** i)
-    epsilon = max(m.epsilon_min, epsilon)
-    model_chance = 100 - epsilon * 100
+steps = np.array([0, 1, 2, 3, 5, 10, 15, 20, 30, 40, 50])
+epsilons = np.maximum(m.epsilon_min, m.epsilon * m.epsilon_decay ** steps)
+model_chances = 100 - epsilons * 100
+for i, epsilon, model_chance in zip(steps.tolist(), epsilons.tolist(), model_chances.tolist()):
     print(f'{i:10d} | {epsilon:6.1%} | {model_chance:6.1f}%')
@@ -3,34 +3,110 @@ Moduł UI - piękny interfejs konsolowy z wykorzystaniem Rich.
 Kolorowe outputy, tabele, panele i czytelne komunikaty.
 """
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.cells import cell_len
+from rich.control import Control
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.layout import Layout
+from rich.prompt import Prompt, IntPrompt
+from rich.style import Style
 from rich.text import Text
 from rich import box
-from typing import List, Dict, Optional
-import time
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
 
+if TYPE_CHECKING:
+    # rich.progress i rich.live importowane leniwie - potrzebne tylko przy paskach postępu
+    from rich.live import Live
+    from rich.progress import Progress, TaskID
 
-class UI:
-    """Zarządza interfejsem użytkownika w konsoli."""
-    
-    def __init__(self):
-        """Inicjalizacja konsoli Rich."""
-        self.console = Console()
-    
-    def clear(self) -> None:
-        """Czyści ekran konsoli."""
-        self.console.clear()
-    
-    def show_welcome(self) -> None:
-        """Wyświetla ekran powitalny."""
-        self.clear()
-        
-        welcome_text = """
+
+# Ile najwyżej linii postępu wypisać na jeden trening/test
+PROGRESS_UPDATES = 100
+
+# Style komunikatów - tekst wiadomości nie przechodzi przez parser markupu
+ERROR_STYLE = Style(color="red", bold=True)
+INFO_STYLE = Style(color="blue")
+SUCCESS_STYLE = Style(color="green", bold=True)
+
+# Potwierdzenia feedbacku - markup parsowany raz, przy imporcie
+LIKE_TEXT = Text.from_markup("[green bold]👍 Like! Idealna odpowiedź![/green bold]")
+DISLIKE_TEXT = Text.from_markup("[red]👎 Dislike. Uczę się z poprawnej odpowiedzi.[/red]")
+
+
+def _render_ansi(text: Text) -> str:
+    """Renderuje Text raz do gotowej linii ANSI (podstawowe 16 kolorów, bez zawijania)."""
+    console = Console(color_system="standard", force_terminal=True, legacy_windows=False, soft_wrap=True)
+    with console.capture() as capture:
+        console.print(text)
+    return capture.get()
+
+
+# Gotowe linie ANSI dla krótkich, częstych komunikatów (wypisywane z pominięciem renderowania Rich)
+ANSI_RESET = "\x1b[0m"
+ANSI_GREEN = "\x1b[32m"
+ANSI_DIM = "\x1b[2m"
+LIKE_ANSI = _render_ansi(LIKE_TEXT)
+DISLIKE_ANSI = _render_ansi(DISLIKE_TEXT)
+
+# Status pojedynczego testu w linii postępu testowania (fragmenty dla Text.assemble)
+TEST_PASSED = ("✓", "green")
+TEST_FAILED = ("✗", "red")
+
+# Kolor accuracy w testowaniu: (próg %, kolor linii postępu, kolor podsumowania), od najwyższego progu
+ACCURACY_COLORS = (
+    (90, "green", "bold green"),
+    (70, "yellow", "bold yellow"),
+    (float("-inf"), "red", "bold red"),
+)
+
+
+# Werdykt po testowaniu: (próg accuracy %, komunikat), od najwyższego progu - markup parsowany raz
+TESTING_VERDICTS = (
+    (95, Text.from_markup("[bold green]🎉 DOSKONALE! Model świetnie rozumie wzorzec![/bold green]")),
+    (80, Text.from_markup("[bold yellow]👍 Dobrze! Model w większości zgaduje poprawnie.[/bold yellow]")),
+    (50, Text.from_markup("[bold yellow]🤔 Średnio. Model potrzebuje więcej treningu.[/bold yellow]")),
+    (float("-inf"), Text.from_markup("[bold red]❌ Słabo. Model nie rozumie wzorca - potrzebny trening![/bold red]")),
+)
+
+
+def _accuracy_colors(accuracy: float) -> Tuple[str, str]:
+    """Zwraca (kolor, pogrubiony kolor) dla accuracy w procentach - pierwszy próg z ACCURACY_COLORS, który osiąga."""
+    for threshold, color, bold_color in ACCURACY_COLORS:
+        if accuracy >= threshold:
+            return color, bold_color
+    return ACCURACY_COLORS[-1][1:]
+
+
+# Odpowiedzi akceptowane w ocenie -> pełna nazwa feedbacku
+FEEDBACK_CHOICES = {'d': 'dislike', 'dislike': 'dislike', 'l': 'like', 'like': 'like'}
+
+# Prompt oceny tworzony raz i wywoływany przy każdej interakcji
+FEEDBACK_PROMPT = Prompt("[bold yellow]Twoja ocena[/bold yellow]",
+                         choices=list(FEEDBACK_CHOICES), show_choices=False)
+
+# Odpowiedzi akceptowane w pytaniach tak/nie (po lower/strip)
+YES_ANSWERS = frozenset({"y", "yes", "t", "tak"})
+NO_ANSWERS = frozenset({"n", "no", "nie"})
+
+# Domyślne i maksymalne liczby przykładów w auto_train / testing_model
+DEFAULT_AUTO_TRAIN_EXAMPLES = 50
+DEFAULT_TESTING_EXAMPLES = 100
+MAX_GENERATED_EXAMPLES = 10000
+
+# Jednostki rozmiaru plików (indeks = potęga 1024)
+FILE_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024 ** 2), ("GB", 1024 ** 3))
+
+# Wyświetlanie feedbacku i trybu w historii (starsze 'love' pokazywane jako 'like')
+LIKE_DISPLAY = "[green]👍 Like[/green]"
+DISLIKE_DISPLAY = "[red]👎 Dislike[/red]"
+FEEDBACK_DISPLAY = {'like': LIKE_DISPLAY, 'love': LIKE_DISPLAY, 'dislike': DISLIKE_DISPLAY}
+MODE_DISPLAY = ("🎯 Predict", "🔍 Explore")  # indeks: bool(exploration)
+
+# Statyczne ekrany budowane raz przy imporcie - show_* tylko je drukuje,
+# bez ponownego składania tekstu i obiektów Panel/Table przy każdym wywołaniu.
+# Treść paneli to gotowy Text - Panel ze zwykłym stringiem parsowałby markup przy każdym renderowaniu
+WELCOME_PANEL = Panel(
+    Text.from_markup("""
 [bold cyan]🤖 Number Learning AI[/bold cyan]
 
 Witaj w interaktywnej aplikacji ML!
@@ -62,51 +138,158 @@ Witaj w interaktywnej aplikacji ML!
   [white]quit[/white]           - Zakończ program
 
 [dim]Algorytm: Epsilon-Greedy + Polynomial Regression[/dim]
+"""),
+    title="💡 Machine Learning Console App",
+    border_style="cyan",
+    box=box.DOUBLE
+)
+
+HELP_COMMANDS = (
+    ("train", "Tryb treningu - kontrolujesz output (wpisz 'stop' aby zakończyć)"),
+    ("auto_train", "Automatyczny trening - generowanie przykładów z operacjami matematycznymi"),
+    ("testing_model", "Automatyczne testowanie modelu na wzorcu (AI dostaje losowe liczby)"),
+    ("history", "Wyświetl ostatnie 10 interakcji"),
+    ("stats", "Pokaż szczegółowe statystyki i postępy"),
+    ("show_formula", "Wypisz wyuczony wzór i współczynniki"),
+    ("explain", "Wyjaśnij ostatnią predykcję AI"),
+    ("reset", "Resetuj tylko dane (zachowaj model)"),
+    ("retrain", "Przetrenuję model na wszystkich danych"),
+    ("undo", "Cofnij ostatnią interakcję i przetrenuję model"),
+    ("new_model", "Utwórz nowy, czysty model (od zera)"),
+    ("save_model", "Zapisz aktualny model pod nazwą"),
+    ("load_model", "Wczytaj zapisany model"),
+    ("list_models", "Pokaż dostępne modele"),
+    ("delete_model", "Usuń zapisany model"),
+    ("export", "Eksportuj dane do CSV"),
+    ("help", "Wyświetl tę pomoc"),
+    ("quit", "Zakończ program"),
+)
+
+def _build_help_table() -> Table:
+    """Buduje tabelę pomocy z HELP_COMMANDS."""
+    help_table = Table(title="📚 Dostępne Komendy", box=box.ROUNDED, border_style="blue")
+    
+    # Kolumna komend ma stałą szerokość (najdłuższa komenda), więc Rich jej nie mierzy;
+    # opis zostaje elastyczny, żeby tabela mogła się zawinąć w wąskim terminalu
+    command_width = max(cell_len(cmd) for cmd, _ in HELP_COMMANDS)
+    help_table.add_column("Komenda", style="cyan", no_wrap=True, width=command_width)
+    help_table.add_column("Opis", style="white")
+    
+    for cmd, desc in HELP_COMMANDS:
+        help_table.add_row(cmd, desc)
+    
+    return help_table
+
+
+HELP_TABLE = _build_help_table()
+
+TRAINING_MODE_PANEL = Panel(Text.from_markup("""
+[bold green]🎓 Tryb Treningu Aktywny[/bold green]
+
+W tym trybie TY kontrolujesz output - uczysz AI dokładnie tego, czego chcesz!
+
+[yellow]Jak to działa:[/yellow]
+1. Podaj INPUT (liczba)
+2. Podaj OUTPUT (liczba, którą AI powinno zwrócić)
+3. AI zapisuje to jako idealny przykład (LIKE 👍)
+4. Powtarzaj aż nauczysz wzorca
+
+[cyan]Przykłady:[/cyan]
+  Podwajanie:  10 → 20, 5 → 10, 7 → 14
+  Dodaj 100:   10 → 110, 50 → 150
+  Razy 3:      5 → 15, 10 → 30
+
+[white]Wpisz 'stop' aby zakończyć trening i wrócić do normalnego trybu.[/white]
+"""), title="📚 Training Mode", 
+              border_style="green", box=box.DOUBLE)
+
+AUTO_TRAINING_MODE_PANEL = Panel(Text.from_markup("""
+[bold green]🤖 Tryb Auto-Treningu Aktywny[/bold green]
+
+AI będzie automatycznie generować przykłady treningowe!
+
+[yellow]Jak to działa:[/yellow]
+1. Podajesz ilość przykładów do wygenerowania
+2. Podajesz operację matematyczną (np. *2, +100, ^2)
+3. AI generuje losowe liczby i stosuje na nich operację
+4. Model trenuje się na tych przykładach
+
+[cyan]Przykłady operacji:[/cyan]
+  [white]*2[/white]    - mnożenie przez 2
+  [white]*3.5[/white]  - mnożenie przez 3.5
+  [white]+100[/white]  - dodawanie 100
+  [white]-50[/white]   - odejmowanie 50
+  [white]/2[/white]    - dzielenie przez 2
+  [white]^2[/white]    - potęgowanie do kwadratu
+  [white]%10[/white]   - modulo 10
+  [white]x*2+10[/white] - złożone wyrażenie (x to liczba wejściowa)
+
+[bold red]⚠️  WAŻNE:[/bold red]
+Model polinomialny (3. stopnia) najlepiej uczy się [bold]jednego wzorca[/bold]. Jeśli masz już dane z innymi
+wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
+
+[dim]AI nauczy się wzorca i będzie go stosować w predykcjach![/dim]
+"""), title="🤖 Auto-Training Mode", 
+              border_style="green", box=box.DOUBLE)
+
+TESTING_MODE_PANEL = Panel(Text.from_markup("""
+[bold blue]🧪 Tryb Testowania Modelu[/bold blue]
+
+Ten tryb automatycznie testuje jak dobrze AI zgaduje wzorzec!
+
+[yellow]Jak to działa:[/yellow]
+1. Podajesz ilość testów do wykonania
+2. Podajesz wzorzec/operację (np. *2, +100)
+3. AI dostaje losowe liczby i próbuje zgadnąć odpowiedź
+4. Jeśli AI zgadnie poprawnie → [green]LIKE 👍[/green]
+5. Jeśli AI się pomyli → [red]DISLIKE + poprawna odpowiedź[/red]
+6. AI uczy się w trakcie testowania!
+
+[cyan]Zastosowanie:[/cyan]
+  • Sprawdzenie jak dobrze model nauczył się wzorca
+  • Kontynuacja treningu z automatycznym feedbackiem
+  • Monitoring postępu modelu (accuracy)
+
+[dim]Model będzie się uczył podczas testowania![/dim]
+"""), title="🧪 Testing Mode", 
+              border_style="blue", box=box.DOUBLE)
+
+GOODBYE_PANEL = Panel(Text.from_markup("""
+[bold cyan]👋 Do zobaczenia![/bold cyan]
+
+Dziękuję za trening. Twoje dane zostały zapisane.
+
+[dim]Model będzie kontynuował naukę przy następnym uruchomieniu.[/dim]
+"""), title="🤖 Goodbye", 
+              border_style="cyan", box=box.DOUBLE)
+
+
+class UI:
+    """Zarządza interfejsem użytkownika w konsoli."""
+    
+    def __init__(self, verbose_progress: bool = True):
         """
+        Inicjalizacja konsoli Rich.
         
-        panel = Panel(
-            welcome_text,
-            title="💡 Machine Learning Console App",
-            border_style="cyan",
-            box=box.DOUBLE
-        )
-        
-        self.console.print(panel)
-        self.console.print()
+        Args:
+            verbose_progress: False = w testowaniu pokazuj tylko końcowy postęp i podsumowanie
+        """
+        self.console = Console()
+        self.verbose_progress = verbose_progress
+        # Ostatnio wypisany fragment postępu (patrz _progress_due)
+        self._progress_bucket = -1
+    
+    def clear(self) -> None:
+        """Czyści ekran konsoli."""
+        self.console.clear()
+    
+    def show_welcome(self) -> None:
+        """Wyświetla ekran powitalny (razem z czyszczeniem ekranu, jednym zapisem)."""
+        self.console.print(Group(Control.clear(), Control.home(), WELCOME_PANEL, ""))
     
     def show_help(self) -> None:
         """Wyświetla pomoc z dostępnymi komendami."""
-        help_table = Table(title="📚 Dostępne Komendy", box=box.ROUNDED, border_style="blue")
-        
-        help_table.add_column("Komenda", style="cyan", no_wrap=True)
-        help_table.add_column("Opis", style="white")
-        
-        commands = [
-            ("train", "Tryb treningu - kontrolujesz output (wpisz 'stop' aby zakończyć)"),
-            ("auto_train", "Automatyczny trening - generowanie przykładów z operacjami matematycznymi"),
-            ("testing_model", "Automatyczne testowanie modelu na wzorcu (AI dostaje losowe liczby)"),
-            ("history", "Wyświetl ostatnie 10 interakcji"),
-            ("stats", "Pokaż szczegółowe statystyki i postępy"),
-            ("show_formula", "Wypisz wyuczony wzór i współczynniki"),
-            ("explain", "Wyjaśnij ostatnią predykcję AI"),
-            ("reset", "Resetuj tylko dane (zachowaj model)"),
-            ("retrain", "Przetrenuję model na wszystkich danych"),
-            ("undo", "Cofnij ostatnią interakcję i przetrenuję model"),
-            ("new_model", "Utwórz nowy, czysty model (od zera)"),
-            ("save_model", "Zapisz aktualny model pod nazwą"),
-            ("load_model", "Wczytaj zapisany model"),
-            ("list_models", "Pokaż dostępne modele"),
-            ("delete_model", "Usuń zapisany model"),
-            ("export", "Eksportuj dane do CSV"),
-            ("help", "Wyświetl tę pomoc"),
-            ("quit", "Zakończ program"),
-        ]
-        
-        for cmd, desc in commands:
-            help_table.add_row(cmd, desc)
-        
-        self.console.print(help_table)
-        self.console.print()
+        self.console.print(Group(HELP_TABLE, ""))
     
     def get_user_input(self) -> Optional[str]:
         """
@@ -155,25 +338,40 @@ Witaj w interaktywnej aplikacji ML!
         self.console.print("  [green]l[/green] / [green]like[/green]       - Idealnie! 👍")
         
         try:
-            feedback = Prompt.ask("[bold yellow]Twoja ocena[/bold yellow]", 
-                                choices=["d", "dislike", "l", "like"],
-                                show_choices=False).lower()
+            feedback = FEEDBACK_PROMPT().lower()
             
             # Normalizuj do pełnych nazw
-            if feedback in ['d', 'dislike']:
-                return 'dislike'
-            elif feedback in ['l', 'like']:
-                return 'like'
+            return FEEDBACK_CHOICES.get(feedback)
             
         except (KeyboardInterrupt, EOFError):
             return None
     
+    def _raw_ansi_enabled(self) -> bool:
+        """Czy można pisać gotowe sekwencje ANSI prosto do pliku konsoli (kolorowy terminal)."""
+        console = self.console
+        # Stara konsola Windows nie rozumie ANSI - Rich koloruje ją przez Win32 API
+        return (console.is_terminal and not console.no_color and console.color_system is not None
+                and not console.legacy_windows)
+    
+    def _raw_print(self, line: str) -> None:
+        """Wypisuje gotową linię (z kodami ANSI) bezpośrednio do pliku konsoli Rich."""
+        file = self.console.file
+        file.write(line)
+        file.flush()
+    
     def show_feedback_confirmation(self, feedback: str) -> None:
         """Wyświetla potwierdzenie feedbacku z emotikonami."""
         if feedback == 'like':
-            self.console.print("[green bold]👍 Like! Idealna odpowiedź![/green bold]")
+            line, text = LIKE_ANSI, LIKE_TEXT
         elif feedback == 'dislike':
-            self.console.print("[red]👎 Dislike. Uczę się z poprawnej odpowiedzi.[/red]")
+            line, text = DISLIKE_ANSI, DISLIKE_TEXT
+        else:
+            return
+        
+        if self._raw_ansi_enabled():
+            self._raw_print(line)
+        else:
+            self.console.print(text)
     
     def get_expected_output(self, user_input: int) -> Optional[int]:
         """
@@ -227,7 +425,7 @@ Witaj w interaktywnej aplikacji ML!
         Wyświetla historię ostatnich interakcji.
         
         Args:
-            interactions: Lista interakcji z bazy danych
+            interactions: Lista interakcji z bazy danych (od najnowszych)
         """
         if not interactions:
             self.console.print("[yellow]Brak historii interakcji.[/yellow]")
@@ -242,25 +440,19 @@ Witaj w interaktywnej aplikacji ML!
         table.add_column("Feedback", justify="center")
         table.add_column("Tryb", style="dim")
         
-        for idx, interaction in enumerate(reversed(interactions), 1):
-            timestamp = interaction['timestamp'][:19]  # YYYY-MM-DD HH:MM:SS
-            user_input = str(interaction['user_input'])
-            output = str(interaction['model_output'])
-            feedback = interaction['feedback']
-            exploration = interaction['exploration']
-            
-            # Koloruj feedback (mapuj starsze 'love' na 'like')
-            if feedback == 'love' or feedback == 'like':
-                feedback_display = "[green]👍 Like[/green]"
-            else:
-                feedback_display = "[red]👎 Dislike[/red]"
-            
-            mode = "🔍 Explore" if exploration else "🎯 Predict"
-            
-            table.add_row(str(idx), timestamp, user_input, output, feedback_display, mode)
+        # Najwyżej 10 najnowszych, wyświetlane od najstarszego - niezależnie od tego, ile przekaże wywołujący.
+        # Wiersze budowane z tablic wyświetlania zamiast if/elif dla każdej interakcji
+        for idx, interaction in enumerate(interactions[:10][::-1], 1):
+            table.add_row(
+                str(idx),
+                interaction['timestamp'][:19],  # YYYY-MM-DD HH:MM:SS
+                str(interaction['user_input']),
+                str(interaction['model_output']),
+                FEEDBACK_DISPLAY.get(interaction['feedback'], DISLIKE_DISPLAY),
+                MODE_DISPLAY[bool(interaction['exploration'])]
+            )
         
-        self.console.print(table)
-        self.console.print()
+        self.console.print(Group(table, ""))
     
     def show_detailed_stats(self, stats: Dict, model_stats: Dict, 
                            session_stats: Dict, trend: str, 
@@ -275,43 +467,47 @@ Witaj w interaktywnej aplikacji ML!
             trend: String z trendem
             learning_curve_chart: Wykres ASCII
         """
-        # Panel główny
-        main_stats = f"""
-[bold cyan]📊 Statystyki Ogólne[/bold cyan]
-  Całkowite interakcje: [white]{stats['total_interactions']}[/white]
-  Pozytywny feedback:   [green]{stats['positive_rate']:.1%}[/green]
-  
-[bold yellow]📈 Rozkład Feedbacku[/bold yellow]
-    Like (👍):     {stats['likes'] + stats.get('loves', 0)} ({(stats['likes'] + stats.get('loves', 0))/max(1, stats['total_interactions']):.1%})
-    Dislike (👎):  {stats['dislikes']} ({stats['dislikes']/max(1, stats['total_interactions']):.1%})
-
-[bold magenta]🤖 Model ML[/bold magenta]
-  Status:          [green]Wytrenowany[/green] if model_stats['is_fitted'] else [red]Uczący się[/red]
-  Epsilon (🔍):    {model_stats['epsilon']:.2%}
-  Sukces modelu:   {model_stats['success_rate']:.1%}
-
-[bold green]⏱️  Obecna Sesja[/bold green]
-  Czas trwania:    {session_stats['duration_str']}
-  Interakcje:      {session_stats['interactions']}
-  Sukces:          {session_stats['positive_rate']:.1%}
-
-[bold blue]📉 Trend (ostatnie 20)[/bold blue]
-  {trend}
-        """
-        
-        panel = Panel(main_stats, title="📈 Szczegółowe Statystyki", 
-                     border_style="cyan", box=box.DOUBLE)
-        
-        self.console.print(panel)
+        # Panel główny - sekcje zbierane w listę i łączone jednym "\n".join
+        total = stats['total_interactions']
+        likes = stats['likes'] + stats.get('loves', 0)
+        status = "[green]Wytrenowany[/green]" if model_stats['is_fitted'] else "[red]Uczący się[/red]"
+        
+        parts = [""]
+        parts.append("[bold cyan]📊 Statystyki Ogólne[/bold cyan]")
+        parts.append(f"  Całkowite interakcje: [white]{total}[/white]")
+        parts.append(f"  Pozytywny feedback:   [green]{stats['positive_rate']:.1%}[/green]")
+        parts.append("  ")
+        parts.append("[bold yellow]📈 Rozkład Feedbacku[/bold yellow]")
+        parts.append(f"    Like (👍):     {likes} ({likes/max(1, total):.1%})")
+        parts.append(f"    Dislike (👎):  {stats['dislikes']} ({stats['dislikes']/max(1, total):.1%})")
+        parts.append("")
+        parts.append("[bold magenta]🤖 Model ML[/bold magenta]")
+        parts.append(f"  Status:          {status}")
+        parts.append(f"  Epsilon (🔍):    {model_stats['epsilon']:.2%}")
+        parts.append(f"  Sukces modelu:   {model_stats['success_rate']:.1%}")
+        parts.append("")
+        parts.append("[bold green]⏱️  Obecna Sesja[/bold green]")
+        parts.append(f"  Czas trwania:    {session_stats['duration_str']}")
+        parts.append(f"  Interakcje:      {session_stats['interactions']}")
+        parts.append(f"  Sukces:          {session_stats['positive_rate']:.1%}")
+        parts.append("")
+        parts.append("[bold blue]📉 Trend (ostatnie 20)[/bold blue]")
+        parts.append(f"  {trend}")
+        parts.append("")
+        main_stats = "\n".join(parts)
+        
+        renderables = [Panel(main_stats, title="📈 Szczegółowe Statystyki", 
+                             border_style="cyan", box=box.DOUBLE)]
         
         # Wykres krzywej uczenia
         if learning_curve_chart:
-            chart_panel = Panel(learning_curve_chart, 
-                              title="📊 Krzywa Uczenia (Accuracy over Time)",
-                              border_style="green", box=box.ROUNDED)
-            self.console.print(chart_panel)
+            renderables.append(Panel(learning_curve_chart, 
+                                     title="📊 Krzywa Uczenia (Accuracy over Time)",
+                                     border_style="green", box=box.ROUNDED))
         
-        self.console.print()
+        # Cały ekran jednym console.print (jeden przebieg renderowania Rich)
+        renderables.append("")
+        self.console.print(Group(*renderables))
     
     def show_explanation(self, explanation: str) -> None:
         """Wyświetla wyjaśnienie ostatniej predykcji."""
@@ -319,17 +515,39 @@ Witaj w interaktywnej aplikacji ML!
                      border_style="yellow", box=box.ROUNDED)
         self.console.print(panel)
         self.console.print()
-
+    
     def show_formula(self, formula: str) -> None:
         """Wyświetla nauczony wzór modelu wraz z współczynnikami."""
         panel = Panel(formula, title="🧠 Wyuczony Wzór", border_style="green", box=box.ROUNDED)
         self.console.print(panel)
         self.console.print()
     
+    def _confirm(self, question: str, default: bool = False) -> bool:
+        """
+        Zadaje pytanie tak/nie i czeka na poprawną odpowiedź.
+        
+        Args:
+            question: Treść pytania (markup Rich)
+            default: Wynik dla pustej odpowiedzi
+            
+        Returns:
+            True dla odpowiedzi z YES_ANSWERS, False dla NO_ANSWERS
+        """
+        prompt = f"{question} [prompt.choices]\\[y/n][/prompt.choices] [prompt.default]({'y' if default else 'n'})[/prompt.default]: "
+        while True:
+            answer = self.console.input(prompt).strip().lower()
+            if not answer:
+                return default
+            if answer in YES_ANSWERS:
+                return True
+            if answer in NO_ANSWERS:
+                return False
+            self.console.print("[prompt.invalid]Wpisz y lub n")
+    
     def confirm_reset(self) -> bool:
         """Prosi o potwierdzenie resetu."""
         self.console.print("[bold yellow]⚠️  UWAGA: Reset usunie wszystkie dane ale ZACHOWA model![/bold yellow]")
-        return Confirm.ask("[yellow]Czy na pewno chcesz zresetować dane?[/yellow]", default=False)
+        return self._confirm("[yellow]Czy na pewno chcesz zresetować dane?[/yellow]", default=False)
     
     def show_reset_confirmation(self) -> None:
         """Potwierdza wykonanie resetu."""
@@ -385,7 +603,7 @@ Witaj w interaktywnej aplikacji ML!
             model_name: Nazwa modelu do usunięcia
         """
         self.console.print(f"[bold red]⚠️  UWAGA: Usuniesz model '{model_name}'![/bold red]")
-        return Confirm.ask("[yellow]Czy na pewno?[/yellow]", default=False)
+        return self._confirm("[yellow]Czy na pewno?[/yellow]", default=False)
     
     def show_model_saved(self, model_name: str, path: str) -> None:
         """Potwierdza zapisanie modelu."""
@@ -404,15 +622,22 @@ Witaj w interaktywnej aplikacji ML!
         """Prosi o potwierdzenie utworzenia nowego modelu."""
         self.console.print("[bold yellow]⚠️  UWAGA: Utworzysz nowy, niewytrenowany model![/bold yellow]")
         self.console.print("[dim]Aktualny model nie zostanie zapisany, chyba że użyjesz 'save_model' wcześniej.[/dim]")
-        return Confirm.ask("[yellow]Czy na pewno chcesz utworzyć nowy model?[/yellow]", default=False)
+        return self._confirm("[yellow]Czy na pewno chcesz utworzyć nowy model?[/yellow]", default=False)
     
     def show_new_model_created(self) -> None:
         """Potwierdza utworzenie nowego modelu."""
         self.console.print("[green]✅ Utworzono nowy, czysty model![/green]")
         self.console.print("[cyan]💡 Możesz teraz trenować go od zera.[/cyan]\n")
     
-    def show_retrain_progress(self) -> None:
-        """Wyświetla progress bar dla retreningu."""
+    def show_retrain_progress(self, work: Callable[[], None]) -> None:
+        """
+        Wyświetla spinner na czas retreningu.
+        
+        Args:
+            work: Funkcja wykonująca retrening (spinner znika, gdy się zakończy)
+        """
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -420,7 +645,7 @@ Witaj w interaktywnej aplikacji ML!
             transient=True
         ) as progress:
             task = progress.add_task("[cyan]Przetre modeluję model na wszystkich danych...", total=None)
-            time.sleep(1)  # Symulacja treningu
+            work()
             progress.update(task, completed=True)
         
         self.console.print("[green]✅ Retraining zakończony![/green]\n")
@@ -431,56 +656,23 @@ Witaj w interaktywnej aplikacji ML!
     
     def show_error(self, message: str) -> None:
         """Wyświetla komunikat błędu."""
-        self.console.print(f"[bold red]❌ Błąd:[/bold red] {message}\n")
+        self.console.print(Text.assemble(("❌ Błąd:", ERROR_STYLE), f" {message}\n"))
     
     def show_info(self, message: str) -> None:
         """Wyświetla komunikat informacyjny."""
-        self.console.print(f"[blue]ℹ️  {message}[/blue]\n")
+        self.console.print(Text(f"ℹ️  {message}\n", style=INFO_STYLE))
     
     def show_success(self, message: str) -> None:
         """Wyświetla komunikat sukcesu."""
-        self.console.print(f"[bold green]{message}[/bold green]\n")
+        self.console.print(Text(f"{message}\n", style=SUCCESS_STYLE))
     
     def show_goodbye(self) -> None:
         """Wyświetla pożegnanie."""
-        goodbye_text = """
-[bold cyan]👋 Do zobaczenia![/bold cyan]
-
-Dziękuję za trening. Twoje dane zostały zapisane.
-
-[dim]Model będzie kontynuował naukę przy następnym uruchomieniu.[/dim]
-        """
-        
-        panel = Panel(goodbye_text, title="🤖 Goodbye", 
-                     border_style="cyan", box=box.DOUBLE)
-        
-        self.console.print(panel)
+        self.console.print(GOODBYE_PANEL)
     
     def show_training_mode_start(self) -> None:
         """Wyświetla info o trybie treningu."""
-        training_info = """
-[bold green]🎓 Tryb Treningu Aktywny[/bold green]
-
-W tym trybie TY kontrolujesz output - uczysz AI dokładnie tego, czego chcesz!
-
-[yellow]Jak to działa:[/yellow]
-1. Podaj INPUT (liczba)
-2. Podaj OUTPUT (liczba, którą AI powinno zwrócić)
-3. AI zapisuje to jako idealny przykład (LIKE 👍)
-4. Powtarzaj aż nauczysz wzorca
-
-[cyan]Przykłady:[/cyan]
-  Podwajanie:  10 → 20, 5 → 10, 7 → 14
-  Dodaj 100:   10 → 110, 50 → 150
-  Razy 3:      5 → 15, 10 → 30
-
-[white]Wpisz 'stop' aby zakończyć trening i wrócić do normalnego trybu.[/white]
-        """
-        
-        panel = Panel(training_info, title="📚 Training Mode", 
-                     border_style="green", box=box.DOUBLE)
-        
-        self.console.print(panel)
+        self.console.print(TRAINING_MODE_PANEL)
     
     def show_training_mode_end(self, count: int) -> None:
         """Wyświetla podsumowanie trybu treningu."""
@@ -505,42 +697,17 @@ W tym trybie TY kontrolujesz output - uczysz AI dokładnie tego, czego chcesz!
     
     def show_training_saved(self, user_input: int, user_output: int) -> None:
         """Potwierdza zapisanie przykładu treningowego."""
-        self.console.print(f"[green]👍 Zapisano:[/green] {user_input} → {user_output} [dim](like)[/dim]")
+        if self._raw_ansi_enabled():
+            self._raw_print(f"{ANSI_GREEN}👍 Zapisano:{ANSI_RESET} {user_input} → {user_output} "
+                            f"{ANSI_DIM}(like){ANSI_RESET}\n")
+            return
+        # Składane z gotowych fragmentów - bez parsowania markupu przy każdym przykładzie
+        self.console.print(Text.assemble(("👍 Zapisano:", "green"), f" {user_input} → {user_output} ",
+                                         ("(like)", "dim")))
     
     def show_auto_training_mode_start(self) -> None:
         """Wyświetla info o trybie auto-treningu."""
-        auto_training_info = """
-[bold green]🤖 Tryb Auto-Treningu Aktywny[/bold green]
-
-AI będzie automatycznie generować przykłady treningowe!
-
-[yellow]Jak to działa:[/yellow]
-1. Podajesz ilość przykładów do wygenerowania
-2. Podajesz operację matematyczną (np. *2, +100, ^2)
-3. AI generuje losowe liczby i stosuje na nich operację
-4. Model trenuje się na tych przykładach
-
-[cyan]Przykłady operacji:[/cyan]
-  [white]*2[/white]    - mnożenie przez 2
-  [white]*3.5[/white]  - mnożenie przez 3.5
-  [white]+100[/white]  - dodawanie 100
-  [white]-50[/white]   - odejmowanie 50
-  [white]/2[/white]    - dzielenie przez 2
-  [white]^2[/white]    - potęgowanie do kwadratu
-  [white]%10[/white]   - modulo 10
-  [white]x*2+10[/white] - złożone wyrażenie (x to liczba wejściowa)
-
-[bold red]⚠️  WAŻNE:[/bold red]
-Model polinomialny (3. stopnia) najlepiej uczy się [bold]jednego wzorca[/bold]. Jeśli masz już dane z innymi
-wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
-
-[dim]AI nauczy się wzorca i będzie go stosować w predykcjach![/dim]
-        """
-        
-        panel = Panel(auto_training_info, title="🤖 Auto-Training Mode", 
-                     border_style="green", box=box.DOUBLE)
-        
-        self.console.print(panel)
+        self.console.print(AUTO_TRAINING_MODE_PANEL)
     
     def confirm_auto_train_reset(self) -> bool:
         """Pyta czy zresetować dane przed auto-treningiem."""
@@ -548,7 +715,7 @@ wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
         self.console.print("[yellow]Dla najlepszych wyników zalecamy reset danych przed auto-treningiem.[/yellow]")
         self.console.print("[yellow]Model polinomialny (3. stopnia) najlepiej uczy się jednego wzorca na czystych danych.[/yellow]\n")
         
-        return Confirm.ask(
+        return self._confirm(
             "[cyan]Czy zresetować dane i model przed treningiem?[/cyan]",
             default=True
         )
@@ -558,13 +725,13 @@ wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
         try:
             count = IntPrompt.ask(
                 "\n[bold yellow]Ile przykładów wygenerować?[/bold yellow]",
-                default=50
+                default=DEFAULT_AUTO_TRAIN_EXAMPLES
             )
             if count <= 0:
                 self.show_error("Liczba musi być większa od 0!")
                 return None
-            if count > 10000:
-                self.show_error("Maksymalna liczba przykładów to 10000!")
+            if count > MAX_GENERATED_EXAMPLES:
+                self.show_error(f"Maksymalna liczba przykładów to {MAX_GENERATED_EXAMPLES}!")
                 return None
             return count
         except (KeyboardInterrupt, EOFError):
@@ -586,17 +753,45 @@ wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
         except (KeyboardInterrupt, EOFError):
             return None
     
-    def show_auto_training_progress(self, current: int, total: int, 
-                                   last_input: int, last_output: int) -> None:
-        """Wyświetla postęp auto-treningu."""
-        percentage = (current / total) * 100
-        self.console.print(
-            f"[cyan]Postęp: {current}/{total} ({percentage:.1f}%)[/cyan] | "
-            f"[dim]Ostatni: {last_input} → {last_output}[/dim]"
+    def start_auto_training_progress(self, total: int) -> Tuple["Progress", "TaskID"]:
+        """
+        Tworzy pasek postępu auto-treningu.
+        
+        Rich odświeża pasek z własną częstotliwością (domyślnie 10 Hz), więc tysiące
+        wywołań progress.update() dają kilkadziesiąt zapisów do terminala zamiast linii na przykład.
+        
+        Args:
+            total: Liczba przykładów do wygenerowania
+            
+        Returns:
+            Tuple (Progress do użycia w bloku with, id zadania dla progress.update(task, advance=..., last=...))
+        """
+        from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+        
+        progress = Progress(
+            TextColumn("[cyan]Postęp[/cyan]"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("[dim]Ostatni: {task.fields[last]}[/dim]"),
+            console=self.console
         )
+        task = progress.add_task("auto_train", total=total, last="-")
+        return progress, task
+    
+    def _progress_due(self, current: int, total: int) -> bool:
+        """Czy wypisać postęp: po wejściu w nowy 1/PROGRESS_UPDATES całości oraz na końcu."""
+        bucket = current * PROGRESS_UPDATES // total
+        if current != total and bucket == self._progress_bucket:
+            return False
+        self._progress_bucket = bucket
+        return True
     
     def show_auto_training_mode_end(self, count: int, operation: str, training_time: float) -> None:
         """Wyświetla podsumowanie trybu auto-treningu."""
+        # Bez przykładów nie ma czego podsumować (i dzielenia przez zero w czasie na przykład)
+        if count == 0:
+            self.console.print("[yellow]Brak przykładów do podsumowania.[/yellow]\n")
+            return
         self.console.print(f"\n[green]✅ Auto-trening zakończony![/green]")
         self.console.print(f"[white]Wygenerowano i wytrenowano {count} przykładów z operacją '[cyan]{operation}[/cyan]'.[/white]")
         self.console.print(f"[dim]Czas online trainingu: {training_time:.2f}s ({training_time/count*1000:.2f}ms na przykład)[/dim]")
@@ -604,8 +799,13 @@ wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
     
     def show_training_time_stats(self, online_time: float, batch_time: float, 
                                 total_time: float, num_examples: int,
-                                file_sizes: Dict) -> None:
-        """Wyświetla szczegółowe statystyki czasowe treningu i rozmiary plików."""
+                                file_sizes_provider: Callable[[], Dict]) -> None:
+        """
+        Wyświetla szczegółowe statystyki czasowe treningu i rozmiary plików.
+        
+        Rozmiary plików są pobierane przez file_sizes_provider dopiero przy rysowaniu
+        tabeli, więc odczyt z dysku nie wchodzi do mierzonego czasu treningu.
+        """
         stats_table = Table(title="⏱️  Statystyki Czasowe Treningu", box=box.ROUNDED, border_style="cyan")
         
         stats_table.add_column("Etap", style="yellow", no_wrap=True)
@@ -634,17 +834,17 @@ wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
             f"[bold]{total_time/60:.2f} minut[/bold]"
         )
         
-        self.console.print(stats_table)
-        
         # Tabela rozmiarów plików
         size_table = Table(title="💾 Rozmiary Plików", box=box.ROUNDED, border_style="magenta")
         size_table.add_column("Plik", style="yellow")
         size_table.add_column("Rozmiar", style="cyan", justify="right")
         
+        file_sizes = file_sizes_provider()
+        
         # Model
         model_size = file_sizes.get('model_bytes', 0)
         model_size_str = self._format_file_size(model_size)
-        size_table.add_row("Model ML (pickle)", model_size_str)
+        size_table.add_row("Model ML (npz)", model_size_str)
         
         # Baza danych
         db_size = file_sizes.get('database_bytes', 0)
@@ -656,64 +856,43 @@ wzorcami w bazie, zalecamy reset przed treningiem dla najlepszych wyników!
         total_size_str = self._format_file_size(total_size)
         size_table.add_row("[bold]CAŁKOWITY ROZMIAR[/bold]", f"[bold green]{total_size_str}[/bold green]")
         
-        self.console.print(size_table)
-        
         # Dodatkowe info
-        self.console.print(f"\n[green]✅ Model zoptymalizowany i zapisany![/green]")
-        self.console.print(f"[cyan]🚀 Wydajność: {num_examples/total_time:.1f} przykładów/s[/cyan]")
-        self.console.print(f"[magenta]💾 Rozmiar na przykład: {total_size/num_examples:.2f} bajtów[/magenta]\n")
+        summary = [
+            "",
+            "[green]✅ Model zoptymalizowany i zapisany![/green]",
+            f"[cyan]🚀 Wydajność: {num_examples/total_time:.1f} przykładów/s[/cyan]",
+            f"[magenta]💾 Rozmiar na przykład: {total_size/num_examples:.2f} bajtów[/magenta]",
+            "",
+        ]
+        
+        # Obie tabele i podsumowanie jednym console.print
+        self.console.print(Group(stats_table, size_table, "\n".join(summary)))
     
     def _format_file_size(self, size_bytes: int) -> str:
         """Formatuje rozmiar pliku do czytelnej postaci."""
-        if size_bytes < 1024:
+        # Jednostka z liczby bitów: każde 10 bitów to kolejna potęga 1024 (bez drabinki if/elif)
+        unit = min(max(0, (size_bytes.bit_length() - 1) // 10), len(FILE_SIZE_UNITS) - 1)
+        if unit == 0:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.2f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+        suffix, divisor = FILE_SIZE_UNITS[unit]
+        return f"{size_bytes / divisor:.2f} {suffix}"
     
     def show_testing_mode_start(self) -> None:
         """Wyświetla info o trybie testowania modelu."""
-        testing_info = """
-[bold blue]🧪 Tryb Testowania Modelu[/bold blue]
-
-Ten tryb automatycznie testuje jak dobrze AI zgaduje wzorzec!
-
-[yellow]Jak to działa:[/yellow]
-1. Podajesz ilość testów do wykonania
-2. Podajesz wzorzec/operację (np. *2, +100)
-3. AI dostaje losowe liczby i próbuje zgadnąć odpowiedź
-4. Jeśli AI zgadnie poprawnie → [green]LIKE 👍[/green]
-5. Jeśli AI się pomyli → [red]DISLIKE + poprawna odpowiedź[/red]
-6. AI uczy się w trakcie testowania!
-
-[cyan]Zastosowanie:[/cyan]
-  • Sprawdzenie jak dobrze model nauczył się wzorca
-  • Kontynuacja treningu z automatycznym feedbackiem
-  • Monitoring postępu modelu (accuracy)
-
-[dim]Model będzie się uczył podczas testowania![/dim]
-        """
-        
-        panel = Panel(testing_info, title="🧪 Testing Mode", 
-                     border_style="blue", box=box.DOUBLE)
-        
-        self.console.print(panel)
+        self.console.print(TESTING_MODE_PANEL)
     
     def get_testing_examples_count(self) -> Optional[int]:
         """Pobiera od użytkownika ilość testów do wykonania."""
         try:
             count = IntPrompt.ask(
                 "\n[bold yellow]Ile testów wykonać?[/bold yellow]",
-                default=100
+                default=DEFAULT_TESTING_EXAMPLES
             )
             if count <= 0:
                 self.show_error("Liczba musi być większa od 0!")
                 return None
-            if count > 10000:
-                self.show_error("Maksymalna liczba testów to 10000!")
+            if count > MAX_GENERATED_EXAMPLES:
+                self.show_error(f"Maksymalna liczba testów to {MAX_GENERATED_EXAMPLES}!")
                 return None
             return count
         except (KeyboardInterrupt, EOFError):
@@ -735,34 +914,63 @@ Ten tryb automatycznie testuje jak dobrze AI zgaduje wzorzec!
         except (KeyboardInterrupt, EOFError):
             return None
     
-    def show_testing_progress(self, current: int, total: int, 
-                             test_input: int, ai_answer: int, 
-                             correct_answer: int, is_correct: bool,
-                             accuracy: float) -> None:
-        """Wyświetla postęp testowania."""
-        percentage = (current / total) * 100
+    def start_testing_progress(self) -> "Live":
+        """
+        Tworzy region Live na postęp testowania.
         
-        # Status: ✓ lub ✗
-        status = "[green]✓[/green]" if is_correct else "[red]✗[/red]"
+        Linia postępu jest podmieniana w miejscu (najwyżej 10 odświeżeń na sekundę)
+        zamiast dopisywania nowej linii przy każdej aktualizacji.
         
-        # Koloruj accuracy
-        if accuracy >= 90:
-            acc_color = "green"
-        elif accuracy >= 70:
-            acc_color = "yellow"
-        else:
-            acc_color = "red"
+        Returns:
+            Live do użycia w bloku with i przekazywania do update_testing_progress
+        """
+        from rich.live import Live
+        
+        # Nowy przebieg - fragment postępu z poprzedniego nie może zablokować pierwszych linii
+        self._progress_bucket = -1
+        return Live("", console=self.console, refresh_per_second=10)
+    
+    def update_testing_progress(self, live: "Live", current: int, total: int, 
+                                test_input: int, ai_answer: int, 
+                                correct_answer: int, is_correct: bool,
+                                accuracy: float) -> None:
+        """Aktualizuje linię postępu testowania (najwyżej PROGRESS_UPDATES razy plus ostatnia)."""
+        if not self.verbose_progress and current != total:
+            return
+        if not self._progress_due(current, total):
+            return
         
-        self.console.print(
-            f"[cyan]Test: {current}/{total} ({percentage:.1f}%)[/cyan] | "
-            f"{status} Input: {test_input} | AI: {ai_answer} | Poprawna: {correct_answer} | "
-            f"[{acc_color}]Accuracy: {accuracy:.1f}%[/{acc_color}]"
-        )
+        percentage = (current / total) * 100
+        
+        acc_color, _ = _accuracy_colors(accuracy)
+        
+        # Linia składana z gotowych fragmentów i stylów - bez parsowania markupu przy każdej aktualizacji
+        live.update(Text.assemble(
+            (f"Test: {current}/{total} ({percentage:.1f}%)", "cyan"), " | ",
+            TEST_PASSED if is_correct else TEST_FAILED,
+            f" Input: {test_input} | AI: {ai_answer} | Poprawna: {correct_answer} | ",
+            (f"Accuracy: {accuracy:.1f}%", acc_color)
+        ))
     
     def show_testing_mode_end(self, total_tests: int, correct: int, 
                              accuracy: float, operation: str, 
-                             testing_time: float) -> None:
-        """Wyświetla podsumowanie trybu testowania."""
+                             testing_time: float, skipped_tests: int = 0) -> None:
+        """
+        Wyświetla podsumowanie trybu testowania.
+        
+        Args:
+            total_tests: Liczba wykonanych testów
+            correct: Liczba poprawnych odpowiedzi
+            accuracy: Accuracy w procentach
+            operation: Testowany wzorzec
+            testing_time: Czas testowania w sekundach
+            skipped_tests: Liczba testów pominiętych (operacja bez prawidłowego wyniku)
+        """
+        # Bez testów nie ma czego podsumować (i dzielenia przez zero w średnim czasie)
+        if total_tests == 0:
+            self.console.print("[yellow]Brak testów do raportowania.[/yellow]\n")
+            return
+        
         # Tabela wyników
         results_table = Table(title="📊 Wyniki Testowania", box=box.ROUNDED, border_style="blue")
         
@@ -770,35 +978,22 @@ Ten tryb automatycznie testuje jak dobrze AI zgaduje wzorzec!
         results_table.add_column("Wartość", style="cyan", justify="right")
         
         results_table.add_row("Wykonane testy", str(total_tests))
+        if skipped_tests:
+            results_table.add_row("Pominięte testy", f"[dim]{skipped_tests}[/dim]")
         results_table.add_row("Poprawne odpowiedzi", f"[green]{correct}[/green]")
         results_table.add_row("Błędne odpowiedzi", f"[red]{total_tests - correct}[/red]")
         
         # Koloruj accuracy w zależności od wyniku
-        if accuracy >= 90:
-            acc_color = "bold green"
-        elif accuracy >= 70:
-            acc_color = "bold yellow"
-        else:
-            acc_color = "bold red"
+        _, acc_color = _accuracy_colors(accuracy)
         
         results_table.add_row("[bold]ACCURACY[/bold]", f"[{acc_color}]{accuracy:.2f}%[/{acc_color}]")
         results_table.add_row("Wzorzec", f"[magenta]{operation}[/magenta]")
         results_table.add_row("Czas", f"{testing_time:.2f}s")
         results_table.add_row("Średni czas/test", f"{testing_time/total_tests*1000:.2f}ms")
         
-        self.console.print()
-        self.console.print(results_table)
-        
-        # Komunikat końcowy
-        self.console.print()
-        if accuracy >= 95:
-            self.console.print("[bold green]🎉 DOSKONALE! Model świetnie rozumie wzorzec![/bold green]")
-        elif accuracy >= 80:
-            self.console.print("[bold yellow]👍 Dobrze! Model w większości zgaduje poprawnie.[/bold yellow]")
-        elif accuracy >= 50:
-            self.console.print("[bold yellow]🤔 Średnio. Model potrzebuje więcej treningu.[/bold yellow]")
-        else:
-            self.console.print("[bold red]❌ Słabo. Model nie rozumie wzorca - potrzebny trening![/bold red]")
+        # Komunikat końcowy - pierwszy próg z TESTING_VERDICTS, który accuracy osiąga
+        verdict = next((text for threshold, text in TESTING_VERDICTS if accuracy >= threshold),
+                       TESTING_VERDICTS[-1][1])
         
-        self.console.print()
+        self.console.print(Group("", results_table, "", verdict, ""))
 